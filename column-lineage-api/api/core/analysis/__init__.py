@@ -5,7 +5,7 @@ This module contains the core analysis functionality for processing
 database views and generating column lineage information.
 """
 
-from .main import process_all_views, save_results_to_csv, get_analysis_summary
+from .main import process_all_views, ProcessResult, save_results_to_csv, get_analysis_summary, clear_ddl_cache, fetch_view_ddls, shutdown_parse_pool
 from .integrated_parser import CompleteIntegratedParser
 from .config import (
     SQL_KEYWORDS,
@@ -17,8 +17,12 @@ from .config import (
 
 __all__ = [
     'process_all_views',
+    'ProcessResult',
     'save_results_to_csv',
     'get_analysis_summary',
+    'clear_ddl_cache',
+    'fetch_view_ddls',
+    'shutdown_parse_pool',
     'CompleteIntegratedParser',
     'SQL_KEYWORDS',
     'DERIVED_EXPRESSION_TYPES',
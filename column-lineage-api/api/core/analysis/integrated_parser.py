@@ -9,6 +9,80 @@ from sqlglot import exp
 import csv
 import io
 import re
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
+from typing import List, Optional
+
+
+@lru_cache(maxsize=256)
+def _parse_cached(sql_text: str, dialect: str) -> exp.Expression:
+    """parse_one memoized on (text, dialect)
+
+    CTE bodies are re-parsed once per column resolved against them, and the
+    same view DDL is often analyzed more than once. Trees are shared between
+    callers, so they must be treated as read-only.
+    """
+    return sqlglot.parse_one(sql_text, dialect=dialect)
+
+
+def _leaf_sql(node) -> str:
+    """str(node) for Table/Column leaves, skipping the defensive deep copy
+
+    The generator only rewrites statement-level nodes, so leaves can be
+    rendered in place; anything with subqueries should keep using str().
+    """
+    return node.sql(copy=False)
+
+
+@dataclass
+class _AstIndex:
+    """Nodes of one parsed statement, bucketed by type in a single walk"""
+    root: exp.Expression
+    selects: List[exp.Select] = field(default_factory=list)
+    tables: List[exp.Table] = field(default_factory=list)
+    ctes: List[exp.CTE] = field(default_factory=list)
+    stars: List[exp.Star] = field(default_factory=list)
+    identifier_calls: List[exp.Anonymous] = field(default_factory=list)
+    
+    @classmethod
+    def build(cls, parsed):
+        """Walk the tree once, keeping walk order within each bucket"""
+        idx = cls(parsed)
+        # sqlglot node classes are concrete leaves, so an exact-type lookup
+        # replaces the isinstance chains each pass used to run per node
+        buckets = {
+            exp.Select: idx.selects.append,
+            exp.Table: idx.tables.append,
+            exp.CTE: idx.ctes.append,
+            exp.Star: idx.stars.append,
+        }
+        get_bucket = buckets.get
+        for node in parsed.walk():
+            node_type = type(node)
+            append = get_bucket(node_type)
+            if append is not None:
+                append(node)
+            elif node_type is exp.Anonymous and str(node.this).upper() == 'IDENTIFIER':
+                idx.identifier_calls.append(node)
+        return idx
+    
+    @cached_property
+    def named_tables(self):
+        """(node, rendered name) for every table, shared by the V1 and V2 passes"""
+        return [(node, _leaf_sql(node)) for node in self.tables]
+    
+    @cached_property
+    def main_select(self) -> Optional[exp.Select]:
+        """First SELECT in walk order that is not inside a CTE"""
+        for node in self.selects:
+            parent = node.parent
+            while parent:
+                if isinstance(parent, exp.CTE):
+                    break
+                parent = parent.parent
+            else:
+                return node
+        return None
 
 
 class CompleteIntegratedParser:
@@ -16,11 +90,16 @@ class CompleteIntegratedParser:
     
     def __init__(self, dialect="snowflake"):
         self.dialect = dialect
+        # Exact-type dispatch for SELECT list entries; other types are skipped
+        self._v1_select_expr_handlers = {
+            exp.Alias: self._v1_handle_alias_expr,
+            exp.Column: self._v1_handle_column_expr,
+        }
         
     def analyze_ddl_statement(self, sql_text):
         """Analyze any DDL statement with improved pattern detection and no duplicates"""
         try:
-            parsed = sqlglot.parse_one(sql_text, dialect=self.dialect)
+            parsed = _parse_cached(sql_text, self.dialect)
             
             # Determine DDL type and structure
             ddl_info = self._analyze_ddl_structure(parsed)
@@ -41,18 +120,21 @@ class CompleteIntegratedParser:
                 'cte_column_details': {}
             }
             
+            # Walk the tree once; the pattern and extraction passes read the buckets
+            idx = _AstIndex.build(parsed)
+            
             # Detect SQL pattern and choose approach
-            sql_pattern = self._detect_sql_pattern(parsed, analysis)
+            sql_pattern = self._detect_sql_pattern(idx, analysis)
             
             if sql_pattern == 'identifier_function':
-                return self._analyze_identifier_pattern(parsed, analysis)
+                return self._analyze_identifier_pattern(idx, analysis)
             elif sql_pattern == 'wildcard_dominant':
-                return self._analyze_using_v2_approach(parsed, analysis)
+                return self._analyze_using_v2_approach(idx, analysis)
             elif sql_pattern == 'nested_cte_dominant':
-                return self._analyze_using_v1_approach(parsed, analysis)
+                return self._analyze_using_v1_approach(idx, analysis)
             else:
                 # Hybrid approach
-                return self._analyze_using_hybrid_approach(parsed, analysis)
+                return self._analyze_using_hybrid_approach(idx, analysis)
                 
         except Exception as e:
             return {'error': f"Analysis failed: {str(e)}"}
@@ -147,28 +229,15 @@ class CompleteIntegratedParser:
             pass
         return columns
     
-    def _detect_sql_pattern(self, parsed, analysis):
+    def _detect_sql_pattern(self, idx, analysis):
         """Improved pattern detection to choose the right approach"""
         # Check for IDENTIFIER() function
-        for node in parsed.walk():
-            if isinstance(node, exp.Anonymous) and str(node.this).upper() == 'IDENTIFIER':
-                return 'identifier_function'
+        if idx.identifier_calls:
+            return 'identifier_function'
         
         # Count different SQL elements
-        cte_count = 0
-        wildcard_count = 0
-        explicit_alias_count = 0
-        select_count = 0
-        
-        for node in parsed.walk():
-            if isinstance(node, exp.CTE):
-                cte_count += 1
-            elif isinstance(node, exp.Star):
-                wildcard_count += 1
-            elif isinstance(node, exp.Alias):
-                explicit_alias_count += 1
-            elif isinstance(node, exp.Select):
-                select_count += 1
+        cte_count = len(idx.ctes)
+        wildcard_count = len(idx.stars)
         
         if cte_count >= 1 and wildcard_count > 0:
             pattern = 'hybrid'
@@ -181,17 +250,16 @@ class CompleteIntegratedParser:
         
         return pattern
     
-    def _analyze_identifier_pattern(self, parsed, analysis):
+    def _analyze_identifier_pattern(self, idx, analysis):
         """Handle IDENTIFIER() function pattern"""
         # Extract IDENTIFIER() table name
         identifier_table = None
-        for node in parsed.walk():
-            if isinstance(node, exp.Anonymous) and str(node.this).upper() == 'IDENTIFIER':
-                if node.expressions:
-                    table_name_expr = node.expressions[0]
-                    if isinstance(table_name_expr, exp.Literal):
-                        identifier_table = table_name_expr.this
-                        break
+        for node in idx.identifier_calls:
+            if node.expressions:
+                table_name_expr = node.expressions[0]
+                if isinstance(table_name_expr, exp.Literal):
+                    identifier_table = table_name_expr.this
+                    break
         
         if not identifier_table:
             return {'error': 'Could not extract IDENTIFIER table name'}
@@ -206,14 +274,14 @@ class CompleteIntegratedParser:
             } 
         return analysis
     
-    def _analyze_using_hybrid_approach(self, parsed, analysis):
+    def _analyze_using_hybrid_approach(self, idx, analysis):
         """Hybrid approach that combines V1 and V2 intelligently"""
         
         # First, run V1 approach to get CTE analysis
-        v1_result = self._analyze_using_v1_approach(parsed, analysis.copy())
+        v1_result = self._analyze_using_v1_approach(idx, analysis.copy())
         
         # Then, run V2 approach to get wildcard analysis
-        v2_result = self._analyze_using_v2_approach(parsed, analysis.copy())
+        v2_result = self._analyze_using_v2_approach(idx, analysis.copy())
         
         # Merge results
         merged_analysis = analysis.copy()
@@ -271,7 +339,7 @@ class CompleteIntegratedParser:
             if not column_assigned:
                 missing_columns.append(col)
         
-        self._resolve_missing_columns_from_main_select(parsed, missing_columns, merged_analysis)
+        self._resolve_missing_columns_from_main_select(idx, missing_columns, merged_analysis)
         
         # Resolve unknown columns
         unknown_columns = []
@@ -284,7 +352,7 @@ class CompleteIntegratedParser:
         elif unknown_columns:
             self._resolve_simple_wildcard_columns(unknown_columns, merged_analysis)
         elif len(analysis['object_columns']) > 0 and len(merged_analysis['column_mappings']) == 0 and len(merged_analysis['derived_columns']) == 0:
-            self._resolve_missing_columns_from_main_select(parsed, analysis['object_columns'], merged_analysis)
+            self._resolve_missing_columns_from_main_select(idx, analysis['object_columns'], merged_analysis)
         elif missing_columns and len(merged_analysis.get('cte_definitions', {})) > 0:
             self._resolve_cte_wildcard_columns(missing_columns, merged_analysis)
         
@@ -543,24 +611,11 @@ class CompleteIntegratedParser:
                         'resolved_method': 'fallback_main_table'
                     }
     
-    def _resolve_missing_columns_from_main_select(self, parsed, missing_columns, analysis):
+    def _resolve_missing_columns_from_main_select(self, idx, missing_columns, analysis):
         """Targeted resolution of missing columns from main SELECT statement"""
         
         # Find the main SELECT statement (not in CTE)
-        main_select = None
-        for node in parsed.walk():
-            if isinstance(node, exp.Select):
-                parent = node.parent
-                in_cte = False
-                while parent:
-                    if isinstance(parent, exp.CTE):
-                        in_cte = True
-                        break
-                    parent = parent.parent
-                
-                if not in_cte:
-                    main_select = node
-                    break
+        main_select = idx.main_select
         
         if not main_select:
             return
@@ -606,27 +661,26 @@ class CompleteIntegratedParser:
                         referenced_columns = set()
                         
                         # Extract column references from the expression
-                        for node in source_expr.walk():
-                            if isinstance(node, exp.Column):
-                                node_table_ref = node.table
-                                node_col_name = str(node.name)
+                        for node in source_expr.find_all(exp.Column):
+                            node_table_ref = node.table
+                            node_col_name = str(node.name)
                                 
-                                if node_table_ref:
-                                    # Qualified column
-                                    node_table_ref_str = str(node_table_ref)
-                                    actual_table = analysis['table_aliases'].get(node_table_ref_str.lower(), node_table_ref_str)
-                                    if ' AS ' in actual_table:
-                                        actual_table = actual_table.split(' AS ')[0]
-                                    referenced_tables.add(actual_table)
-                                    referenced_columns.add(node_col_name)
-                                else:
-                                    # Unqualified column - try to resolve from CTEs
-                                    resolved_tables, resolved_cols = self._resolve_derived_column_source(
-                                        node_col_name, None, analysis
-                                    )
-                                    if resolved_tables:
-                                        referenced_tables.update(resolved_tables)
-                                        referenced_columns.update(resolved_cols)
+                            if node_table_ref:
+                                # Qualified column
+                                node_table_ref_str = str(node_table_ref)
+                                actual_table = analysis['table_aliases'].get(node_table_ref_str.lower(), node_table_ref_str)
+                                if ' AS ' in actual_table:
+                                    actual_table = actual_table.split(' AS ')[0]
+                                referenced_tables.add(actual_table)
+                                referenced_columns.add(node_col_name)
+                            else:
+                                # Unqualified column - try to resolve from CTEs
+                                resolved_tables, resolved_cols = self._resolve_derived_column_source(
+                                    node_col_name, None, analysis
+                                )
+                                if resolved_tables:
+                                    referenced_tables.update(resolved_tables)
+                                    referenced_columns.update(resolved_cols)
                         
                         if referenced_tables:
                             primary_table = list(referenced_tables)[0]
@@ -709,32 +763,32 @@ class CompleteIntegratedParser:
                                 'resolved_method': 'missing_column_recovery_unqualified'
                             }
     
-    def _analyze_using_v1_approach(self, parsed, analysis):
+    def _analyze_using_v1_approach(self, idx, analysis):
         """V1 approach - excellent for nested CTEs and derived columns"""
         
         # Extract basic structure
-        self._v1_extract_tables_and_aliases(parsed, analysis)
-        self._v1_extract_ctes(parsed, analysis)
-        self._v1_analyze_column_lineage(parsed, analysis)
-        self._v1_analyze_cte_columns_detailed(parsed, analysis)
+        self._v1_extract_tables_and_aliases(idx, analysis)
+        self._v1_extract_ctes(idx, analysis)
+        self._v1_analyze_column_lineage(idx, analysis)
+        self._v1_analyze_cte_columns_detailed(idx, analysis)
         self._v1_enhance_derived_columns_with_cte_tracing(analysis)
         self._v1_resolve_view_columns_through_ctes(analysis)
-        self._v1_resolve_main_select_derived_columns(parsed, analysis)
+        self._v1_resolve_main_select_derived_columns(idx, analysis)
         
         return analysis
     
-    def _analyze_using_v2_approach(self, parsed, analysis):
+    def _analyze_using_v2_approach(self, idx, analysis):
         """V2 approach - excellent for wildcards and simple direct mappings"""
-        self._v1_extract_tables_and_aliases(parsed, analysis)
-        self._v1_extract_ctes(parsed, analysis)
+        self._v1_extract_tables_and_aliases(idx, analysis)
+        self._v1_extract_ctes(idx, analysis)
         
-        main_select = self._v2_find_main_select(parsed)
+        main_select = self._v2_find_main_select(idx)
         if not main_select:
             return analysis
         
         main_select_analysis = self._v2_analyze_select_expressions(main_select)
-        table_registry = self._v2_build_table_registry(parsed)
-        cte_registry = self._v2_build_cte_registry(parsed, table_registry)
+        table_registry = self._v2_build_table_registry(idx)
+        cte_registry = self._v2_build_cte_registry(idx, table_registry)
         
         analysis['main_select_analysis'] = main_select_analysis
         analysis['table_registry'] = table_registry
@@ -754,69 +808,79 @@ class CompleteIntegratedParser:
         return analysis
     
     # ==================== V1 METHODS ====================
-    def _v1_extract_tables_and_aliases(self, parsed, analysis):
+    def _v1_extract_tables_and_aliases(self, idx, analysis):
         """Extract all table references and their aliases"""
         view_name = analysis.get('object_name', '')
+        source_tables = analysis['source_tables']
+        table_aliases = analysis['table_aliases']
         
-        for node in parsed.walk():
-            if isinstance(node, exp.Table):
-                table_name = str(node)
+        for node, table_name in idx.named_tables:
+            # Skip the view itself as a source table
+            if table_name == view_name:
+                continue
                 
-                # Skip the view itself as a source table
-                if table_name == view_name:
-                    continue
+            source_tables.append(table_name)
+            
+            alias = node.alias
+            if alias:
+                table_aliases[alias.lower()] = table_name
+            else:
+                implicit_alias = table_name.split('.')[-1].lower()
+                # Don't add implicit alias if it would conflict with view name
+                if table_name != view_name:
+                    table_aliases[implicit_alias] = table_name
                     
-                analysis['source_tables'].append(table_name)
-                
-                if node.alias:
-                    alias = str(node.alias)
-                    analysis['table_aliases'][alias.lower()] = table_name
-                else:
-                    implicit_alias = table_name.split('.')[-1].lower()
-                    # Don't add implicit alias if it would conflict with view name
-                    if table_name != view_name:
-                        analysis['table_aliases'][implicit_alias] = table_name
-                        
-    def _v1_extract_ctes(self, parsed, analysis):
+    def _v1_extract_ctes(self, idx, analysis):
         """Extract Common Table Expressions"""
-        for node in parsed.walk():
-            if isinstance(node, exp.CTE):
-                cte_name = str(node.alias)
-                analysis['cte_definitions'][cte_name] = {
-                    'name': cte_name,
-                    'definition': str(node.this)
-                }
-                analysis['table_aliases'][cte_name.lower()] = f"CTE_{cte_name}"
+        for node in idx.ctes:
+            cte_name = str(node.alias)
+            analysis['cte_definitions'][cte_name] = {
+                'name': cte_name,
+                'definition': str(node.this)
+            }
+            analysis['table_aliases'][cte_name.lower()] = f"CTE_{cte_name}"
     
-    def _v1_analyze_column_lineage(self, parsed, analysis):
+    def _v1_analyze_column_lineage(self, idx, analysis):
         """Analyze column lineage"""
-        for node in parsed.walk():
-            if isinstance(node, exp.Select):
-                self._v1_analyze_select_statement(node, analysis)
+        for node in idx.selects:
+            self._v1_analyze_select_statement(node, analysis)
     
     def _v1_analyze_select_statement(self, select_node, analysis):
         """Analyze a single SELECT statement"""
+        handlers = self._v1_select_expr_handlers
         for expr in select_node.expressions:
-            if isinstance(expr, exp.Alias):
-                column_alias = str(expr.alias)
-                source_expr = expr.this
-                
-                if isinstance(source_expr, exp.Column):
-                    self._v1_map_direct_column(column_alias, source_expr, analysis)
+            handler = handlers.get(type(expr))
+            if handler is None:
+                # Subclasses such as exp.Pseudocolumn miss the exact-type lookup
+                if isinstance(expr, exp.Alias):
+                    handler = self._v1_handle_alias_expr
+                elif isinstance(expr, exp.Column):
+                    handler = self._v1_handle_column_expr
                 else:
-                    self._v1_map_derived_column(column_alias, source_expr, analysis)
-            
-            elif isinstance(expr, exp.Column):
-                column_name = str(expr.name)
-                self._v1_map_direct_column(column_name, expr, analysis)
+                    continue
+            handler(expr, analysis)
+    
+    def _v1_handle_alias_expr(self, expr, analysis):
+        """SELECT list entry of the form <expression> AS <alias>"""
+        column_alias = str(expr.alias)
+        source_expr = expr.this
+        
+        if isinstance(source_expr, exp.Column):
+            self._v1_map_direct_column(column_alias, source_expr, analysis)
+        else:
+            self._v1_map_derived_column(column_alias, source_expr, analysis)
+    
+    def _v1_handle_column_expr(self, expr, analysis):
+        """Bare column reference in a SELECT list"""
+        self._v1_map_direct_column(expr.name, expr, analysis)
     
     def _v1_map_direct_column(self, column_name, column_expr, analysis):
         """Map a direct column reference"""
         table_ref = column_expr.table
-        source_column = str(column_expr.name)
+        source_column = column_expr.name
         
         if table_ref:
-            table_ref_str = str(table_ref)
+            table_ref_str = table_ref
             actual_table = analysis['table_aliases'].get(table_ref_str.lower(), table_ref_str)
             
             analysis['column_mappings'][column_name] = {
@@ -830,22 +894,22 @@ class CompleteIntegratedParser:
         """Map a derived column"""
         referenced_columns = []
         unqualified_columns = []
+        table_aliases = analysis['table_aliases']
         
-        for node in expression.walk():
-            if isinstance(node, exp.Column):
-                table_ref = node.table
-                col_name = str(node.name)
+        for node in expression.find_all(exp.Column):
+            table_ref = node.table
+            col_name = node.name
                 
-                if table_ref:
-                    table_ref_str = str(table_ref)
-                    actual_table = analysis['table_aliases'].get(table_ref_str.lower(), table_ref_str)
-                    referenced_columns.append({
-                        'table': actual_table,
-                        'column': col_name,
-                        'alias': table_ref_str
-                    })
-                else:
-                    unqualified_columns.append(col_name)
+            if table_ref:
+                table_ref_str = table_ref
+                actual_table = table_aliases.get(table_ref_str.lower(), table_ref_str)
+                referenced_columns.append({
+                    'table': actual_table,
+                    'column': col_name,
+                    'alias': table_ref_str
+                })
+            else:
+                unqualified_columns.append(col_name)
         
         analysis['derived_columns'][column_name] = {
             'expression': str(expression),
@@ -854,14 +918,14 @@ class CompleteIntegratedParser:
             'unqualified_columns': unqualified_columns
         }
     
-    def _v1_analyze_cte_columns_detailed(self, parsed, analysis):
+    def _v1_analyze_cte_columns_detailed(self, idx, analysis):
         """Detailed analysis of what columns each CTE provides"""
         
         for cte_name, cte_info in analysis['cte_definitions'].items():
             cte_columns = {}
             
-            for node in parsed.walk():
-                if isinstance(node, exp.CTE) and str(node.alias) == cte_name:
+            for node in idx.ctes:
+                if str(node.alias) == cte_name:
                     select_node = node.this
                     
                     for expr in select_node.expressions:
@@ -898,18 +962,17 @@ class CompleteIntegratedParser:
                                 referenced_cols = []
                                 unqualified_cols = []
                                 
-                                for sub_node in source_expr.walk():
-                                    if isinstance(sub_node, exp.Column):
-                                        sub_table_ref = sub_node.table
-                                        if sub_table_ref and str(sub_table_ref).lower() in analysis['table_aliases']:
-                                            actual_table = analysis['table_aliases'][str(sub_table_ref).lower()]
-                                            referenced_cols.append({
-                                                'table': actual_table,
-                                                'column': str(sub_node.name),
-                                                'alias': str(sub_table_ref)
-                                            })
-                                        else:
-                                            unqualified_cols.append(str(sub_node.name))
+                                for sub_node in source_expr.find_all(exp.Column):
+                                    sub_table_ref = sub_node.table
+                                    if sub_table_ref and str(sub_table_ref).lower() in analysis['table_aliases']:
+                                        actual_table = analysis['table_aliases'][str(sub_table_ref).lower()]
+                                        referenced_cols.append({
+                                            'table': actual_table,
+                                            'column': str(sub_node.name),
+                                            'alias': str(sub_table_ref)
+                                        })
+                                    else:
+                                        unqualified_cols.append(str(sub_node.name))
                                 
                                 cte_columns[alias_name] = {
                                     'type': 'derived',
@@ -1146,17 +1209,11 @@ class CompleteIntegratedParser:
         
         try:
             # Method 1: Parse with sqlglot for accurate AST analysis
-            parsed_cte = sqlglot.parse_one(cte_def, dialect=self.dialect)
+            parsed_cte = _parse_cached(cte_def, self.dialect)
             
             # Find the SELECT statement
-            select_stmt = None
-            if isinstance(parsed_cte, sqlglot.exp.Select):
-                select_stmt = parsed_cte
-            else:
-                for node in parsed_cte.walk():
-                    if isinstance(node, sqlglot.exp.Select):
-                        select_stmt = node
-                        break
+            # find() checks parsed_cte itself first, then descends breadth-first
+            select_stmt = parsed_cte.find(sqlglot.exp.Select)
             
             if select_stmt:
                 # Look for the column in SELECT expressions
@@ -1216,22 +1273,21 @@ class CompleteIntegratedParser:
             referenced_tables = set()
             referenced_columns = set()
             
-            for node in expr.walk():
-                if isinstance(node, sqlglot.exp.Column):
-                    node_table_ref = node.table
-                    node_col_name = str(node.name)
+            for node in expr.find_all(sqlglot.exp.Column):
+                node_table_ref = node.table
+                node_col_name = str(node.name)
                     
-                    if node_table_ref:
-                        node_table_alias = str(node_table_ref)
-                        actual_table = self._find_actual_table_for_alias(node_table_alias, select_stmt, analysis)
-                        if actual_table:
-                            referenced_tables.add(actual_table)
-                            referenced_columns.add(node_col_name)
-                    else:
-                        resolved_table = self._resolve_unqualified_dynamically(node_col_name, select_stmt, analysis)
-                        if resolved_table:
-                            referenced_tables.add(resolved_table)
-                            referenced_columns.add(node_col_name)
+                if node_table_ref:
+                    node_table_alias = str(node_table_ref)
+                    actual_table = self._find_actual_table_for_alias(node_table_alias, select_stmt, analysis)
+                    if actual_table:
+                        referenced_tables.add(actual_table)
+                        referenced_columns.add(node_col_name)
+                else:
+                    resolved_table = self._resolve_unqualified_dynamically(node_col_name, select_stmt, analysis)
+                    if resolved_table:
+                        referenced_tables.add(resolved_table)
+                        referenced_columns.add(node_col_name)
             
             if referenced_tables:
                 return {
@@ -1260,8 +1316,8 @@ class CompleteIntegratedParser:
                 if isinstance(table_expr, sqlglot.exp.Table):
                     if hasattr(table_expr, 'alias') and table_expr.alias:
                         if str(table_expr.alias).lower() == table_alias.lower():
-                            return str(table_expr)
-                    table_name = str(table_expr)
+                            return _leaf_sql(table_expr)
+                    table_name = _leaf_sql(table_expr)
                     implicit_alias = table_name.split('.')[-1].lower()
                     if implicit_alias == table_alias.lower():
                         return table_name
@@ -1272,8 +1328,8 @@ class CompleteIntegratedParser:
                     join_table = join.this
                     if hasattr(join_table, 'alias') and join_table.alias:
                         if str(join_table.alias).lower() == table_alias.lower():
-                            return str(join_table)
-                    table_name = str(join_table)
+                            return _leaf_sql(join_table)
+                    table_name = _leaf_sql(join_table)
                     implicit_alias = table_name.split('.')[-1].lower()
                     if implicit_alias == table_alias.lower():
                         return table_name
@@ -1297,7 +1353,7 @@ class CompleteIntegratedParser:
             join_tables = []
             for join in select_stmt.find_all(sqlglot.exp.Join):
                 if join.this and isinstance(join.this, sqlglot.exp.Table):
-                    join_tables.append(str(join.this))
+                    join_tables.append(_leaf_sql(join.this))
             
             # Add JOIN tables in reverse order (most recent first)
             tables_in_order.extend(reversed(join_tables))
@@ -1305,7 +1361,7 @@ class CompleteIntegratedParser:
             # Add FROM table last (lowest precedence)
             from_clause = select_stmt.find(sqlglot.exp.From)
             if from_clause and from_clause.this and isinstance(from_clause.this, sqlglot.exp.Table):
-                tables_in_order.append(str(from_clause.this))
+                tables_in_order.append(_leaf_sql(from_clause.this))
             
             # Return the first table (highest precedence)
             if tables_in_order:
@@ -1669,23 +1725,10 @@ class CompleteIntegratedParser:
                 'traced_through_cte': True
             }
     
-    def _v1_resolve_main_select_derived_columns(self, parsed, analysis):
+    def _v1_resolve_main_select_derived_columns(self, idx, analysis):
         """Enhanced resolution of derived columns from the main SELECT statement"""
         
-        main_select = None
-        for node in parsed.walk():
-            if isinstance(node, exp.Select):
-                parent = node.parent
-                in_cte = False
-                while parent:
-                    if isinstance(parent, exp.CTE):
-                        in_cte = True
-                        break
-                    parent = parent.parent
-                
-                if not in_cte:
-                    main_select = node
-                    break
+        main_select = idx.main_select
         
         if not main_select:
             return
@@ -1758,63 +1801,62 @@ class CompleteIntegratedParser:
         if expression_type == 'Window':
             self._extract_window_function_columns(expression, ultimate_tables, source_columns, referenced_columns, analysis)
         else:
-            for node in expression.walk():
-                if isinstance(node, exp.Column):
-                    table_ref = node.table
-                    col_name = str(node.name)
+            for node in expression.find_all(exp.Column):
+                table_ref = node.table
+                col_name = str(node.name)
                     
-                    if table_ref:
-                        table_ref_str = str(table_ref)
+                if table_ref:
+                    table_ref_str = str(table_ref)
                         
-                        if table_ref_str in analysis.get('cte_column_details', {}):
-                            resolved_tables, resolved_cols = self._resolve_cte_reference(
-                                table_ref_str, col_name, analysis
-                            )
+                    if table_ref_str in analysis.get('cte_column_details', {}):
+                        resolved_tables, resolved_cols = self._resolve_cte_reference(
+                            table_ref_str, col_name, analysis
+                        )
                             
-                            if resolved_tables:
-                                ultimate_tables.update(resolved_tables)
-                                source_columns.update(resolved_cols)
-                                
-                                for table in resolved_tables:
-                                    for col in resolved_cols:
-                                        referenced_columns.append({
-                                            'table': table,
-                                            'column': col,
-                                            'alias': table_ref_str,
-                                            'resolved_from_cte': True
-                                        })
-                            else:
-                                actual_table = analysis['table_aliases'].get(table_ref_str.lower(), table_ref_str)
-                                if ' AS ' in actual_table:
-                                    actual_table = actual_table.split(' AS ')[0]
-                                if actual_table.startswith('CTE_'):
-                                    actual_table = actual_table[4:]
-                                
-                                ultimate_tables.add(actual_table)
-                                source_columns.add(col_name)
+                        if resolved_tables:
+                            ultimate_tables.update(resolved_tables)
+                            source_columns.update(resolved_cols)
                                 
-                                referenced_columns.append({
-                                    'table': actual_table,
-                                    'column': col_name,
-                                    'alias': table_ref_str
-                                })
+                            for table in resolved_tables:
+                                for col in resolved_cols:
+                                    referenced_columns.append({
+                                        'table': table,
+                                        'column': col,
+                                        'alias': table_ref_str,
+                                        'resolved_from_cte': True
+                                    })
                         else:
                             actual_table = analysis['table_aliases'].get(table_ref_str.lower(), table_ref_str)
                             if ' AS ' in actual_table:
                                 actual_table = actual_table.split(' AS ')[0]
                             if actual_table.startswith('CTE_'):
                                 actual_table = actual_table[4:]
-                            
+                                
                             ultimate_tables.add(actual_table)
                             source_columns.add(col_name)
-                            
+                                
                             referenced_columns.append({
                                 'table': actual_table,
                                 'column': col_name,
                                 'alias': table_ref_str
                             })
                     else:
-                        unqualified_columns.append(col_name)
+                        actual_table = analysis['table_aliases'].get(table_ref_str.lower(), table_ref_str)
+                        if ' AS ' in actual_table:
+                            actual_table = actual_table.split(' AS ')[0]
+                        if actual_table.startswith('CTE_'):
+                            actual_table = actual_table[4:]
+                            
+                        ultimate_tables.add(actual_table)
+                        source_columns.add(col_name)
+                            
+                        referenced_columns.append({
+                            'table': actual_table,
+                            'column': col_name,
+                            'alias': table_ref_str
+                        })
+                else:
+                    unqualified_columns.append(col_name)
         
         # Resolve unqualified columns
         for unqual_col in unqualified_columns:
@@ -1884,58 +1926,41 @@ class CompleteIntegratedParser:
     def _extract_window_function_columns(self, window_expr, ultimate_tables, source_columns, referenced_columns, analysis):
         """Extract column references from window function PARTITION BY and ORDER BY clauses"""
         
-        for node in window_expr.walk():
-            if isinstance(node, exp.Column):
-                table_ref = node.table
-                col_name = str(node.name)
+        for node in window_expr.find_all(exp.Column):
+            table_ref = node.table
+            col_name = str(node.name)
                 
-                if table_ref:
-                    table_ref_str = str(table_ref)
+            if table_ref:
+                table_ref_str = str(table_ref)
                     
-                    if table_ref_str in analysis.get('cte_column_details', {}):
-                        resolved_tables, resolved_columns = self._resolve_cte_reference(
-                            table_ref_str, col_name, analysis
-                        )
+                if table_ref_str in analysis.get('cte_column_details', {}):
+                    resolved_tables, resolved_columns = self._resolve_cte_reference(
+                        table_ref_str, col_name, analysis
+                    )
                         
-                        if resolved_tables:
-                            ultimate_tables.update(resolved_tables)
-                            source_columns.update(resolved_columns)
-                            
-                            for table in resolved_tables:
-                                for col in resolved_columns:
-                                    referenced_columns.append({
-                                        'table': table,
-                                        'column': col,
-                                        'alias': table_ref_str,
-                                        'resolved_from_cte': True,
-                                        'context': 'window_function'
-                                    })
-                        else:
-                            actual_table = analysis['table_aliases'].get(table_ref_str.lower(), table_ref_str)
-                            if ' AS ' in actual_table:
-                                actual_table = actual_table.split(' AS ')[0]
-                            if actual_table.startswith('CTE_'):
-                                actual_table = actual_table[4:]
-                            
-                            ultimate_tables.add(actual_table)
-                            source_columns.add(col_name)
+                    if resolved_tables:
+                        ultimate_tables.update(resolved_tables)
+                        source_columns.update(resolved_columns)
                             
-                            referenced_columns.append({
-                                'table': actual_table,
-                                'column': col_name,
-                                'alias': table_ref_str,
-                                'context': 'window_function'
-                            })
+                        for table in resolved_tables:
+                            for col in resolved_columns:
+                                referenced_columns.append({
+                                    'table': table,
+                                    'column': col,
+                                    'alias': table_ref_str,
+                                    'resolved_from_cte': True,
+                                    'context': 'window_function'
+                                })
                     else:
                         actual_table = analysis['table_aliases'].get(table_ref_str.lower(), table_ref_str)
                         if ' AS ' in actual_table:
                             actual_table = actual_table.split(' AS ')[0]
                         if actual_table.startswith('CTE_'):
                             actual_table = actual_table[4:]
-                        
+                            
                         ultimate_tables.add(actual_table)
                         source_columns.add(col_name)
-                        
+                            
                         referenced_columns.append({
                             'table': actual_table,
                             'column': col_name,
@@ -1943,46 +1968,62 @@ class CompleteIntegratedParser:
                             'context': 'window_function'
                         })
                 else:
-                    # Unqualified column in window function
-                    resolved = False
+                    actual_table = analysis['table_aliases'].get(table_ref_str.lower(), table_ref_str)
+                    if ' AS ' in actual_table:
+                        actual_table = actual_table.split(' AS ')[0]
+                    if actual_table.startswith('CTE_'):
+                        actual_table = actual_table[4:]
+                        
+                    ultimate_tables.add(actual_table)
+                    source_columns.add(col_name)
+                        
+                    referenced_columns.append({
+                        'table': actual_table,
+                        'column': col_name,
+                        'alias': table_ref_str,
+                        'context': 'window_function'
+                    })
+            else:
+                # Unqualified column in window function
+                resolved = False
                     
-                    for cte_name in analysis.get('cte_column_details', {}).keys():
-                        resolved_tables, resolved_columns = self._resolve_cte_reference(
-                            cte_name, col_name, analysis
-                        )
+                for cte_name in analysis.get('cte_column_details', {}).keys():
+                    resolved_tables, resolved_columns = self._resolve_cte_reference(
+                        cte_name, col_name, analysis
+                    )
                         
-                        if resolved_tables:
-                            ultimate_tables.update(resolved_tables)
-                            source_columns.update(resolved_columns)
+                    if resolved_tables:
+                        ultimate_tables.update(resolved_tables)
+                        source_columns.update(resolved_columns)
                             
-                            for table in resolved_tables:
-                                for col in resolved_columns:
-                                    referenced_columns.append({
-                                        'table': table,
-                                        'column': col,
-                                        'alias': '',
-                                        'resolved_from_cte': True,
-                                        'context': 'window_function_unqualified'
-                                    })
-                            resolved = True
-                            break
+                        for table in resolved_tables:
+                            for col in resolved_columns:
+                                referenced_columns.append({
+                                    'table': table,
+                                    'column': col,
+                                    'alias': '',
+                                    'resolved_from_cte': True,
+                                    'context': 'window_function_unqualified'
+                                })
+                        resolved = True
+                        break
                     
-                    if not resolved:
-                        for alias, table_name in analysis.get('table_aliases', {}).items():
-                            if not table_name.startswith('CTE_') and table_name != analysis.get('object_name', ''):
-                                if ' AS ' in table_name:
-                                    table_name = table_name.split(' AS ')[0]
+                if not resolved:
+                    for alias, table_name in analysis.get('table_aliases', {}).items():
+                        if not table_name.startswith('CTE_') and table_name != analysis.get('object_name', ''):
+                            if ' AS ' in table_name:
+                                table_name = table_name.split(' AS ')[0]
                                 
-                                ultimate_tables.add(table_name)
-                                source_columns.add(col_name)
+                            ultimate_tables.add(table_name)
+                            source_columns.add(col_name)
                                 
-                                referenced_columns.append({
-                                    'table': table_name,
-                                    'column': col_name,
-                                    'alias': alias,
-                                    'context': 'window_function_inferred'
-                                })
-                                break
+                            referenced_columns.append({
+                                'table': table_name,
+                                'column': col_name,
+                                'alias': alias,
+                                'context': 'window_function_inferred'
+                            })
+                            break
     
     def _resolve_cte_reference(self, table_name, column_name, analysis):
         """Enhanced CTE reference resolution with dynamic recursive tracing"""
@@ -2354,13 +2395,12 @@ class CompleteIntegratedParser:
         return resolved_tables, resolved_columns
     
     # ==================== V2 METHODS ====================
-    def _v2_find_main_select(self, parsed):
+    def _v2_find_main_select(self, idx):
         """Find the main SELECT statement dynamically"""
         all_selects = []
         
-        for node in parsed.walk():
-            if isinstance(node, exp.Select):
-                all_selects.append(node)
+        for node in idx.selects:
+            all_selects.append(node)
         
         if not all_selects:
             return None
@@ -2406,9 +2446,9 @@ class CompleteIntegratedParser:
                 analysis['has_wildcard'] = True
                 if hasattr(expr, 'table') and expr.table:
                     analysis['wildcard_source'] = str(expr.table)
-            elif isinstance(expr, exp.Column) and str(expr).endswith('.*'):
+            elif isinstance(expr, exp.Column) and _leaf_sql(expr).endswith('.*'):
                 analysis['has_wildcard'] = True
-                wildcard_str = str(expr)
+                wildcard_str = _leaf_sql(expr)
                 if '.' in wildcard_str:
                     analysis['wildcard_source'] = wildcard_str.split('.')[0]
             elif isinstance(expr, exp.Alias):
@@ -2429,78 +2469,74 @@ class CompleteIntegratedParser:
         
         return analysis
     
-    def _v2_build_table_registry(self, parsed):
+    def _v2_build_table_registry(self, idx):
         """Build registry of all tables and their aliases"""
         registry = {}
         
-        for node in parsed.walk():
-            if isinstance(node, exp.Table):
-                table_name = str(node)
-                
-                if node.alias:
-                    alias = str(node.alias)
-                    registry[alias] = {
-                        'type': 'table',
-                        'full_name': table_name,
-                        'alias': alias
-                    }
-                
-                implicit_alias = table_name.split('.')[-1]
-                if implicit_alias not in registry:
-                    registry[implicit_alias] = {
-                        'type': 'table',
-                        'full_name': table_name,
-                        'alias': implicit_alias
-                    }
+        for node, table_name in idx.named_tables:
+            alias = node.alias
+            if alias:
+                registry[alias] = {
+                    'type': 'table',
+                    'full_name': table_name,
+                    'alias': alias
+                }
+            
+            implicit_alias = table_name.split('.')[-1]
+            if implicit_alias not in registry:
+                registry[implicit_alias] = {
+                    'type': 'table',
+                    'full_name': table_name,
+                    'alias': implicit_alias
+                }
         
         return registry
     
-    def _v2_build_cte_registry(self, parsed, table_registry):
+    def _v2_build_cte_registry(self, idx, table_registry):
         """Build registry of all CTEs and their column mappings"""
         registry = {}
         
-        for node in parsed.walk():
-            if isinstance(node, exp.CTE):
-                cte_name = str(node.alias)
-                cte_select = node.this
-                
-                cte_analysis = self._v2_analyze_select_expressions(cte_select)
-                column_mapping = {}
-                
-                for expr_info in cte_analysis['explicit_expressions']:
-                    if 'alias' in expr_info:
-                        alias = expr_info['alias']
-                        if expr_info['type'] == 'Column':
-                            column_mapping[alias] = self._v2_parse_column_reference(
-                                expr_info['expression'], table_registry
-                            )
-                        else:
-                            column_mapping[alias] = {
-                                'type': 'derived',
-                                'expression': expr_info['expression'],
-                                'expression_type': expr_info['type']
-                            }
-                
-                if cte_analysis['has_wildcard']:
-                    wildcard_source = cte_analysis.get('wildcard_source')
-                    if wildcard_source and wildcard_source in table_registry:
-                        column_mapping['__WILDCARD__'] = {
-                            'type': 'wildcard',
-                            'source_table': table_registry[wildcard_source]['full_name'],
-                            'source_alias': wildcard_source
-                        }
-                    elif cte_analysis['from_source'] and cte_analysis['from_source'] in table_registry:
-                        from_source = cte_analysis['from_source']
-                        column_mapping['__WILDCARD__'] = {
-                            'type': 'wildcard',
-                            'source_table': table_registry[from_source]['full_name'],
-                            'source_alias': from_source
+        for node in idx.ctes:
+            cte_name = str(node.alias)
+            cte_select = node.this
+            
+            cte_analysis = self._v2_analyze_select_expressions(cte_select)
+            column_mapping = {}
+            
+            for expr_info in cte_analysis['explicit_expressions']:
+                if 'alias' in expr_info:
+                    alias = expr_info['alias']
+                    if expr_info['type'] == 'Column':
+                        column_mapping[alias] = self._v2_parse_column_reference(
+                            expr_info['expression'], table_registry
+                        )
+                    else:
+                        column_mapping[alias] = {
+                            'type': 'derived',
+                            'expression': expr_info['expression'],
+                            'expression_type': expr_info['type']
                         }
-                
-                registry[cte_name] = {
-                    'column_mapping': column_mapping,
-                    'analysis': cte_analysis
-                }
+            
+            if cte_analysis['has_wildcard']:
+                wildcard_source = cte_analysis.get('wildcard_source')
+                if wildcard_source and wildcard_source in table_registry:
+                    column_mapping['__WILDCARD__'] = {
+                        'type': 'wildcard',
+                        'source_table': table_registry[wildcard_source]['full_name'],
+                        'source_alias': wildcard_source
+                    }
+                elif cte_analysis['from_source'] and cte_analysis['from_source'] in table_registry:
+                    from_source = cte_analysis['from_source']
+                    column_mapping['__WILDCARD__'] = {
+                        'type': 'wildcard',
+                        'source_table': table_registry[from_source]['full_name'],
+                        'source_alias': from_source
+                    }
+            
+            registry[cte_name] = {
+                'column_mapping': column_mapping,
+                'analysis': cte_analysis
+            }
         
         return registry
     
@@ -2609,32 +2645,31 @@ class CompleteIntegratedParser:
         
         try:
             import sqlglot
-            parsed_expr = sqlglot.parse_one(f"SELECT {expression}", dialect="snowflake")
+            parsed_expr = _parse_cached(f"SELECT {expression}", "snowflake")
             
-            for node in parsed_expr.walk():
-                if isinstance(node, sqlglot.exp.Column):
-                    col_name = str(node.name)
-                    table_ref = None
+            for node in parsed_expr.find_all(sqlglot.exp.Column):
+                col_name = str(node.name)
+                table_ref = None
                     
-                    if hasattr(node, 'table') and node.table:
-                        table_ref = str(node.table)
+                if hasattr(node, 'table') and node.table:
+                    table_ref = str(node.table)
                     
-                    resolved_tables, resolved_columns = self._resolve_derived_column_source(
-                        col_name, table_ref, analysis
-                    )
+                resolved_tables, resolved_columns = self._resolve_derived_column_source(
+                    col_name, table_ref, analysis
+                )
                     
-                    if resolved_tables:
-                        ultimate_tables.update(resolved_tables)
-                        source_columns.update(resolved_columns)
+                if resolved_tables:
+                    ultimate_tables.update(resolved_tables)
+                    source_columns.update(resolved_columns)
                         
-                        for table in resolved_tables:
-                            for column in resolved_columns:
-                                referenced_columns.append({
-                                    'table': table,
-                                    'column': column,
-                                    'alias': table_ref or '',
-                                    'original_column': col_name
-                                })  
+                    for table in resolved_tables:
+                        for column in resolved_columns:
+                            referenced_columns.append({
+                                'table': table,
+                                'column': column,
+                                'alias': table_ref or '',
+                                'original_column': col_name
+                            })  
         except Exception:
             pass
         if referenced_columns:
@@ -6,13 +6,148 @@ Processes views from snowflake and generates CSV output as requested.
 
 import os
 import sys
+import hashlib
+import multiprocessing
+import threading
+import time
 import pandas as pd
-from typing import Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import Optional, List, Tuple, Dict, Set, Callable, NamedTuple
 from pathlib import Path
 
 from api.dependencies.database_connection import SnowflakeConnection
 from .integrated_parser import CompleteIntegratedParser
 
+# The parser keeps no per-call state, so one instance backs the analysis cache
+_parser = CompleteIntegratedParser()
+
+# sqlglot parsing is CPU-bound and holds the GIL; when enabled, parses are
+# shipped to a process pool that is created once and reused across jobs.
+# Workers are spawned, not forked: the API process already runs DB, analysis
+# and connector threads whose held locks a forked child would inherit.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+# SHA-1 of the DDL text -> (error, csv_output). Keyed on the digest alone so
+# the cache does not hold every DDL string; oldest entries go first when full.
+_ANALYSIS_CACHE_MAX_ENTRIES = 4096
+_analysis_cache: Dict[str, Tuple[Optional[str], str]] = {}
+_analysis_cache_lock = threading.Lock()
+
+# (catalog, schema, view) -> (last_altered, cached_at, ddl), shared across jobs.
+# LAST_ALTERED invalidates changed views; the TTL bounds how long entries live.
+_DDL_CACHE_TTL_SECONDS = 24 * 60 * 60
+_ddl_cache: Dict[Tuple[str, str, str], Tuple[object, float, str]] = {}
+_ddl_cache_lock = threading.Lock()
+
+# Fallback GET_DDL lookups overlap their round trips on this shared pool
+_DDL_PROBE_THREADS = 8
+_ddl_probe_pool = ThreadPoolExecutor(max_workers=_DDL_PROBE_THREADS, thread_name_prefix="ddl-probe")
+
+
+def fetch_view_ddls(engine, view_names: List[str]) -> Tuple[Dict[str, str], Set[str]]:
+    """
+    Fetch view definitions for all requested views in as few round trips as possible.
+    
+    A cheap LAST_ALTERED probe runs first; DDL text is only pulled for views that
+    are new, changed since they were cached, or whose cache entry has expired.
+    
+    Args:
+        engine: Database engine to query
+        view_names: View names to look up (matched case-insensitively)
+    
+    Returns:
+        Tuple of (DDL by upper-cased view name, upper-cased unqualified names
+        the probe confirmed do not exist in the current database). Views with
+        no definition available are omitted from the first so callers can fall
+        back to GET_DDL. Qualified names ("SCHEMA.VIEW") never match the probe
+        and may live in another database, so they are never reported missing;
+        if the probe itself fails, nothing is reported missing.
+    """
+    if not view_names:
+        return {}, set()
+    
+    try:
+        from sqlalchemy import text, bindparam
+        
+        upper_names = [name.upper() for name in view_names]
+        
+        versions_sql = text("""
+            SELECT TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, LAST_ALTERED
+            FROM INFORMATION_SCHEMA.VIEWS
+            WHERE TABLE_CATALOG = CURRENT_DATABASE()
+            AND UPPER(TABLE_NAME) IN :view_names
+            """).bindparams(bindparam('view_names', expanding=True))
+        
+        definitions_sql = text("""
+            SELECT TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, VIEW_DEFINITION
+            FROM INFORMATION_SCHEMA.VIEWS
+            WHERE TABLE_CATALOG = CURRENT_DATABASE()
+            AND UPPER(TABLE_NAME) IN :view_names
+            """).bindparams(bindparam('view_names', expanding=True))
+        
+        with engine.connect() as connection:
+            versions = pd.read_sql(versions_sql, connection, params={'view_names': upper_names})
+            versions.columns = [col.lower() for col in versions.columns]
+            
+            now = time.monotonic()
+            current = {}
+            stale_names = set()
+            with _ddl_cache_lock:
+                for row in versions.itertuples(index=False):
+                    key = (row.table_catalog, row.table_schema, row.table_name)
+                    current[key] = row.last_altered
+                    cached = _ddl_cache.get(key)
+                    if (cached is None or cached[0] != row.last_altered
+                            or now - cached[1] > _DDL_CACHE_TTL_SECONDS):
+                        stale_names.add(row.table_name.upper())
+            
+            if stale_names:
+                definitions = pd.read_sql(
+                    definitions_sql, connection, params={'view_names': sorted(stale_names)}
+                )
+                definitions.columns = [col.lower() for col in definitions.columns]
+                definitions = definitions.dropna(subset=['view_definition'])
+                
+                with _ddl_cache_lock:
+                    for row in definitions.itertuples(index=False):
+                        key = (row.table_catalog, row.table_schema, row.table_name)
+                        if key in current:
+                            _ddl_cache[key] = (current[key], now, row.view_definition)
+        
+        ddls = {}
+        with _ddl_cache_lock:
+            for key in current:
+                cached = _ddl_cache.get(key)
+                if cached is None:
+                    continue
+                _, schema, name = key
+                name = name.upper()
+                # Prefer CPS_DSCI_API when a view exists in several schemas,
+                # matching find_view_in_schemas
+                if name not in ddls or schema == 'CPS_DSCI_API':
+                    ddls[name] = cached[2]
+        
+        # Only unqualified names are resolvable by the probe; anything else is
+        # left to the GET_DDL fallback
+        missing = {name for name in upper_names if '.' not in name}.difference(
+            name.upper() for _, _, name in current
+        )
+        
+        print(f"Prefetched DDL for {len(ddls)}/{len(view_names)} views "
+              f"({len(stale_names)} fetched, rest cached, {len(missing)} not found)")
+        return ddls, missing
+        
+    except Exception as e:
+        print(f"Error prefetching view DDLs: {e}")
+        return {}, set()
+
+
+def clear_ddl_cache() -> None:
+    """Drop every cached view DDL so the next prefetch reads them all again."""
+    with _ddl_cache_lock:
+        _ddl_cache.clear()
+
 
 class _EngineWrappedConnection:
     """Wrapper that makes an injected engine work with SnowflakeConnection interface"""
@@ -63,59 +198,51 @@ class _EngineWrappedConnection:
     
     def get_qualified_ddl(self, view_name: str) -> str:
         """Get DDL with proper schema qualification."""
-        schema = self.find_view_in_schemas(view_name)
+        if '.' in view_name:
+            # Already qualified; the schema probe only matches bare view names
+            return self.get_ddl_for_view(view_name)
         
-        if schema:
-            qualified_name = f"{schema}.{view_name}"
-            return self.get_ddl_for_view(qualified_name)
-        else:
+        # Run the schema probe alongside GET_DDL for its two most likely answers
+        # (the preferred schema, or no schema at all), so the common cases take
+        # one round trip of latency instead of two in sequence
+        schema_probe = _ddl_probe_pool.submit(self.find_view_in_schemas, view_name)
+        preferred = _ddl_probe_pool.submit(self.get_ddl_for_view, f"CPS_DSCI_API.{view_name}", False)
+        unqualified = _ddl_probe_pool.submit(self.get_ddl_for_view, view_name, False)
+        
+        schema = schema_probe.result()
+        if schema == 'CPS_DSCI_API':
+            return preferred.result()
+        if not schema:
             # Try without schema qualification
-            return self.get_ddl_for_view(view_name)
+            return unqualified.result()
+        return self.get_ddl_for_view(f"{schema}.{view_name}")
     
     def find_view_in_schemas(self, view_name: str) -> str:
-        """Find which schema contains the view."""
-        # First check CPS_DSCI_API
+        """Find which schema contains the view, preferring CPS_DSCI_API."""
+        # One probe across all schemas instead of CPS_DSCI_API first, then the rest
         try:
-            sql = f"""
-            SELECT table_schema 
-            FROM information_schema.views 
-            WHERE table_name = '{view_name}' 
-            AND table_schema = 'CPS_DSCI_API'
-            """
-            
-            with self.engine.connect() as connection:
-                import pandas as pd
-                from sqlalchemy import text
-                result = pd.read_sql(text(sql), connection)
-            
-            if not result.empty:
-                return 'CPS_DSCI_API'
-                
-        except Exception:
-            pass
-        
-        # If not found, check all schemas
-        try:
-            sql = f"""
+            sql = """
             SELECT table_schema 
             FROM information_schema.views 
-            WHERE table_name = '{view_name}'
+            WHERE table_name = :view_name
+            ORDER BY CASE WHEN table_schema = 'CPS_DSCI_API' THEN 0 ELSE 1 END
+            LIMIT 1
             """
             
             with self.engine.connect() as connection:
                 import pandas as pd
                 from sqlalchemy import text
-                result = pd.read_sql(text(sql), connection)
+                result = pd.read_sql(text(sql), connection, params={'view_name': view_name})
             
             if not result.empty:
-                return result.iloc[0]['table_schema']
+                return result.iloc[0, 0]
                 
         except Exception:
             pass
             
         return None
     
-    def get_ddl_for_view(self, view_name: str) -> str:
+    def get_ddl_for_view(self, view_name: str, log_errors: bool = True) -> str:
         """Get DDL for a specific view using GET_DDL function."""
         try:
             sql = f"SELECT GET_DDL('VIEW', '{view_name}') as ddl"
@@ -131,11 +258,145 @@ class _EngineWrappedConnection:
                 return None
                 
         except Exception as e:
-            print(f"Error getting DDL for view {view_name}: {e}")
+            # Speculative lookups are expected to miss, so they stay quiet
+            if log_errors:
+                print(f"Error getting DDL for view {view_name}: {e}")
             return None
+    
+    def get_view_ddls(self, view_names: List[str]) -> Tuple[Dict[str, str], Set[str]]:
+        """Get DDL for many views, plus the names confirmed not to exist."""
+        return fetch_view_ddls(self.engine, view_names)
+
+
+def _error_row(view_name: str, reason: str) -> List[str]:
+    """Build the CSV error row recorded for a view that could not be analyzed."""
+    return [view_name.upper(), 'ERROR', 'ERROR', reason, reason, 'ERROR']
 
 
-def process_all_views(sf_env='prod', view_names: Optional[List[str]] = None, engine=None) -> List[List[str]]:
+class ProcessResult(NamedTuple):
+    """Output of process_all_views: the CSV rows plus per-view outcome counts."""
+    csv_rows: List[List[str]]
+    successful_views: int
+    failed_views: int
+
+
+def _parse_ddl_worker(ddl_text: str) -> Tuple[Optional[str], str]:
+    """
+    Parse and analyze one DDL
+    
+    Top-level so it can run in a worker process; each process uses its own
+    module-level parser.
+    
+    Returns:
+        (error, csv_output) - error is None when the analysis succeeded
+    """
+    analysis = _parser.analyze_ddl_statement(ddl_text)
+    if 'error' in analysis:
+        return analysis['error'], ''
+    return None, _parser.generate_standard_csv(analysis)
+
+
+def _get_parse_pool(processes: int) -> ProcessPoolExecutor:
+    """Return the shared parse pool, creating it on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the shared parse pool's worker processes, if it was ever started."""
+    global _parse_pool
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _cached_analyze(ddl_sha1: str, ddl_text: str, parse_processes: int = 0) -> Tuple[Optional[str], str]:
+    """
+    Parse and analyze a DDL once per distinct text
+    
+    Generated views often share identical DDL, so repeat analyses are served
+    from the cache instead of re-running sqlglot. Only ddl_sha1 is used as the
+    cache key; ddl_text is what gets parsed on a miss.
+    
+    Returns:
+        (error, csv_output) - error is None when the analysis succeeded
+    """
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(ddl_sha1)
+    if cached is not None:
+        return cached
+    
+    if parse_processes > 0:
+        result = _get_parse_pool(parse_processes).submit(_parse_ddl_worker, ddl_text).result()
+    else:
+        result = _parse_ddl_worker(ddl_text)
+    
+    with _analysis_cache_lock:
+        if ddl_sha1 not in _analysis_cache and len(_analysis_cache) >= _ANALYSIS_CACHE_MAX_ENTRIES:
+            del _analysis_cache[next(iter(_analysis_cache))]
+        _analysis_cache[ddl_sha1] = result
+    return result
+
+
+def _analyze_single_view(view_name: str, ddl_text: Optional[str], db_connection,
+                         parse_processes: int = 0) -> List[List[str]]:
+    """
+    Analyze one view and return its CSV rows
+    
+    Args:
+        view_name: Name of the view
+        ddl_text: Prefetched DDL, or None to fall back to a GET_DDL lookup
+        db_connection: Connection used for the fallback lookup
+        parse_processes: Size of the shared parse process pool (0 parses in this thread)
+    
+    Returns:
+        List of CSV rows for the view (a single error row on failure)
+    """
+    print(f"Processing {view_name}")
+    
+    try:
+        # Get DDL for the view
+        if not ddl_text:
+            ddl_text = db_connection.get_qualified_ddl(view_name)
+        
+        if not ddl_text:
+            print(f"  Could not retrieve DDL for {view_name}")
+            return [_error_row(view_name, 'DDL_NOT_FOUND')]
+        
+        # Analyze the DDL and generate CSV for this view
+        ddl_sha1 = hashlib.sha1(ddl_text.encode('utf-8')).hexdigest()
+        error, csv_output = _cached_analyze(ddl_sha1, ddl_text, parse_processes)
+        
+        if error:
+            print(f"  Analysis error for {view_name}: {error}")
+            return [_error_row(view_name, 'ANALYSIS_ERROR')]
+        
+        # Parse CSV output into rows
+        csv_rows = []
+        csv_lines = csv_output.strip().split('\n')[1:]  # Skip header
+        for line in csv_lines:
+            if line.strip():
+                parts = [part.strip() for part in line.split(',')]
+                if len(parts) >= 6:
+                    csv_rows.append(parts)
+        
+        print(f"  Successfully processed {view_name} - {len(csv_lines)} columns")
+        return csv_rows
+        
+    except Exception as e:
+        print(f"  Error processing {view_name}: {e}")
+        return [_error_row(view_name, 'PROCESSING_ERROR')]
+
+
+def process_all_views(sf_env='prod', view_names: Optional[List[str]] = None, engine=None,
+                      max_workers: int = 8, parse_processes: int = 0,
+                      progress_callback: Optional[Callable[[int, int], None]] = None) -> ProcessResult:
     """
     Process all views from Snowflake and generate comprehensive analysis
     
@@ -143,9 +404,13 @@ def process_all_views(sf_env='prod', view_names: Optional[List[str]] = None, eng
         sf_env: Environment (prod, dev, stage)
         view_names: Optional list of specific view names to process
         engine: Optional database engine to use (will create SnowflakeConnection with injected engine)
+        max_workers: Maximum number of views analyzed concurrently (1 runs serially)
+        parse_processes: Worker processes for DDL parsing (0 parses in the analysis threads)
+        progress_callback: Optional callable invoked as (processed, total) after each view
     
     Returns:
-        List of CSV rows with analysis results
+        ProcessResult with the CSV rows and how many views produced lineage
+        rows versus an error row (or nothing at all)
     """
     
     # Create database connection
@@ -164,76 +429,50 @@ def process_all_views(sf_env='prod', view_names: Optional[List[str]] = None, eng
         target_views = db_connection.get_view_names_from_snowflake()
         print(f"Processing {len(target_views)} views from Snowflake...")
     
-    # Create parser
-    parser = CompleteIntegratedParser()
+    # Fetch all DDLs up front; views missing from the batch fall back to GET_DDL,
+    # except those the existence probe already showed are not there
+    ddl_lookup, missing_views = db_connection.get_view_ddls(target_views)
     
-    # Results list for CSV
-    all_csv_rows = []
+    def analyze(view_name: str) -> List[List[str]]:
+        if view_name.upper() in missing_views:
+            print(f"  View {view_name} not found, skipping DDL lookup")
+            return [_error_row(view_name, 'DDL_NOT_FOUND')]
+        return _analyze_single_view(
+            view_name, ddl_lookup.get(view_name.upper()), db_connection, parse_processes
+        )
     
-    for i, view_name in enumerate(target_views, 1):
-        print(f"Processing {i}/{len(target_views)}: {view_name}")
-        
-        try:
-            # Get DDL for the view
-            ddl_text = db_connection.get_qualified_ddl(view_name)
-            
-            if not ddl_text:
-                print(f"  Could not retrieve DDL for {view_name}")
-                # Add error row
-                all_csv_rows.append([
-                    view_name.upper(),
-                    'ERROR',
-                    'ERROR',
-                    'DDL_NOT_FOUND',
-                    'DDL_NOT_FOUND',
-                    'ERROR'
-                ])
-                continue
-            
-            print(f"  Retrieved DDL for {view_name}")
-            
-            # Analyze the DDL
-            analysis = parser.analyze_ddl_statement(ddl_text)
-            
-            if 'error' in analysis:
-                print(f"  Analysis error for {view_name}: {analysis['error']}")
-                # Add error row
-                all_csv_rows.append([
-                    view_name.upper(),
-                    'ERROR',
-                    'ERROR',
-                    'ANALYSIS_ERROR',
-                    'ANALYSIS_ERROR',
-                    'ERROR'
-                ])
-                continue
-            
-            # Generate CSV for this view
-            csv_output = parser.generate_standard_csv(analysis)
-            
-            # Parse CSV output and add to results
-            csv_lines = csv_output.strip().split('\n')[1:]  # Skip header
-            for line in csv_lines:
-                if line.strip():
-                    parts = [part.strip() for part in line.split(',')]
-                    if len(parts) >= 6:
-                        all_csv_rows.append(parts)
-            
-            print(f"  Successfully processed {view_name} - {len(csv_lines)} columns")
-            
-        except Exception as e:
-            print(f"  Error processing {view_name}: {e}")
-            # Add error row
-            all_csv_rows.append([
-                view_name.upper(),
-                'ERROR',
-                'ERROR',
-                'PROCESSING_ERROR',
-                'PROCESSING_ERROR',
-                'ERROR'
-            ])
+    total = len(target_views)
+    per_view_rows: List[List[List[str]]] = [[] for _ in target_views]
+    
+    if max_workers <= 1:
+        # Serial path, kept for debugging (plain tracebacks, ordered prints)
+        for index, view_name in enumerate(target_views):
+            per_view_rows[index] = analyze(view_name)
+            if progress_callback:
+                progress_callback(index + 1, total)
+    else:
+        # Views are independent; overlap the fallback DDL round trips across a
+        # bounded pool. Results land in their input slot so output order is
+        # stable, while progress ticks as each view finishes.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(analyze, view_name): index
+                for index, view_name in enumerate(target_views)
+            }
+            for processed, future in enumerate(as_completed(futures), 1):
+                per_view_rows[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(processed, total)
+    
+    all_csv_rows = []
+    successful_views = 0
+    for rows in per_view_rows:
+        all_csv_rows.extend(rows)
+        # A failed view yields a single _error_row, whose column type is ERROR
+        if rows and rows[0][2] != 'ERROR':
+            successful_views += 1
     
-    return all_csv_rows
+    return ProcessResult(all_csv_rows, successful_views, total - successful_views)
 
 
 def save_results_to_csv(results: List[List[str]], filename: str = 'column_lineage_analysis.csv', 
@@ -335,7 +574,7 @@ def main():
         results = process_all_views(sf_env)
         
         # Save to CSV
-        df = save_results_to_csv(results)
+        df = save_results_to_csv(results.csv_rows)
         
         print(f"\n=== ANALYSIS COMPLETE ===")
         print(f"Check 'column_lineage_analysis.csv' for complete results")
@@ -31,11 +31,15 @@ class Settings:
     AUTO_SAVE_RESULTS: bool = os.getenv("AUTO_SAVE_RESULTS", "true").lower() == "true"
     AUTO_SAVE_TO_DATABASE: bool = os.getenv("AUTO_SAVE_TO_DATABASE", "true").lower() == "true"
     RESULTS_DIRECTORY: str = os.getenv("RESULTS_DIRECTORY", "analysis_results")
+    # Write auto-saved CSVs as .csv.gz (gzip level 1)
+    AUTO_SAVE_COMPRESS: bool = os.getenv("AUTO_SAVE_COMPRESS", "false").lower() == "true"
     
     # Auto-save target configuration
     AUTO_SAVE_TARGET_DATABASE: str = os.getenv("AUTO_SAVE_TARGET_DATABASE", "")
     AUTO_SAVE_TARGET_SCHEMA: str = os.getenv("AUTO_SAVE_TARGET_SCHEMA", "")
     AUTO_SAVE_TARGET_TABLE: str = os.getenv("AUTO_SAVE_TARGET_TABLE", "VIEW_TO_SOURCE_COLUMN_LINEAGE")
+    # Rows per executemany call when the staged COPY load is unavailable
+    AUTO_SAVE_BATCH_SIZE: int = int(os.getenv("AUTO_SAVE_BATCH_SIZE", "10000"))
     
     # Auto-save override configuration
     AUTO_SAVE_DATABASE_OVERRIDE: str = os.getenv("AUTO_SAVE_DATABASE_OVERRIDE", "")
@@ -46,6 +50,15 @@ class Settings:
     BASE_VIEW_SAFETY_LIMIT: int = int(os.getenv("BASE_VIEW_SAFETY_LIMIT", "10000"))
     VIEWS_SAFETY_LIMIT: int = int(os.getenv("VIEWS_SAFETY_LIMIT", "1000"))
     
+    # Analysis settings
+    # Views analyzed concurrently per job (1 processes views serially)
+    ANALYSIS_WORKERS: int = int(os.getenv("ANALYSIS_WORKERS", str(min(8, (os.cpu_count() or 1) + 4))))
+    # Worker processes for DDL parsing (0 parses in the analysis threads)
+    ANALYSIS_PARSE_PROCESSES: int = int(os.getenv("ANALYSIS_PARSE_PROCESSES", "0"))
+    
+    # Skip pydantic validation of analysis results (set false to validate in dev)
+    TRUST_ANALYSIS_OUTPUT: bool = os.getenv("TRUST_ANALYSIS_OUTPUT", "true").lower() == "true"
+    
     # API settings
     PROJECT_NAME: str = os.getenv("PROJECT_NAME", "Column Lineage API")
     VERSION: str = os.getenv("VERSION", "0.1.0")
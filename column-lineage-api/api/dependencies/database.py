@@ -1,9 +1,11 @@
 """Database connection dependencies."""
 
 from functools import lru_cache
-from typing import AsyncGenerator, Optional
+from pathlib import Path
+from typing import AsyncGenerator, Optional, Union
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import create_engine, Engine, text
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, AsyncEngine
 from sqlalchemy.orm import sessionmaker
 
@@ -207,16 +209,18 @@ class DatabaseManager:
         SessionLocal = sessionmaker(bind=self.engine)
         return SessionLocal()
     
-    def execute_query(self, query: str, params: dict = None):
-        """Execute a query and return results."""
+    def execute_query(self, query: Union[str, TextClause], params: dict = None):
+        """Execute a query (SQL string or prebuilt text() clause) and return results."""
+        statement = query if isinstance(query, TextClause) else text(query)
+        query = statement.text
+        
         if self.mock_mode:
             self.logger.info("Mock query execution", query=query[:100])
             return []
         
         try:
             with self.engine.connect() as conn:
-                from sqlalchemy import text
-                result = conn.execute(text(query), params or {})
+                result = conn.execute(statement, params or {})
                 
                 # Commit the transaction for DDL and DML statements
                 if any(keyword in query.upper().strip() for keyword in ['CREATE', 'INSERT', 'UPDATE', 'DELETE', 'DROP', 'ALTER', 'TRUNCATE']):
@@ -227,6 +231,130 @@ class DatabaseManager:
             self.logger.error("Query execution failed", query=query, error=str(e))
             raise
     
+    def execute_show_query(self, show_statement: str, scan_query: str, params: dict = None):
+        """
+        Run a SHOW command and query its output via RESULT_SCAN(LAST_QUERY_ID()).
+        
+        Both statements must share a session for LAST_QUERY_ID() to refer to
+        the SHOW, so they are executed on the same connection.
+        """
+        if self.mock_mode:
+            self.logger.info("Mock query execution", query=show_statement[:100])
+            return []
+        
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text(show_statement))
+                result = conn.execute(text(scan_query), params or {})
+                return result.fetchall()
+        except Exception as e:
+            self.logger.error("Query execution failed", query=show_statement, error=str(e))
+            raise
+    
+    def execute_multi(self, statements: list) -> list:
+        """
+        Submit several statements as a single multi-statement request.
+        
+        The statements run in order in one session and one round trip, so a
+        SHOW followed by its RESULT_SCAN(LAST_QUERY_ID()) can be batched as
+        well. A failing statement aborts the rest of the request.
+        
+        Returns:
+            One list of rows per statement (empty when it returns no result set)
+        """
+        if self.mock_mode:
+            self.logger.info("Mock multi-statement execution", statements=len(statements))
+            return [[] for _ in statements]
+        
+        sql = ";\n".join(statement.strip().rstrip(";") for statement in statements)
+        try:
+            with self.engine.connect() as conn:
+                # num_statements is a Snowflake cursor option, so go through
+                # the DBAPI cursor rather than conn.execute
+                cursor = conn.connection.cursor()
+                try:
+                    cursor.execute(sql, num_statements=len(statements))
+                    result_sets = []
+                    while True:
+                        result_sets.append(cursor.fetchall() if cursor.description else [])
+                        if not cursor.nextset():
+                            return result_sets
+                finally:
+                    cursor.close()
+        except Exception as e:
+            self.logger.error("Multi-statement execution failed", query=sql, error=str(e))
+            raise
+    
+    def execute_many(self, query: str, rows: list) -> int:
+        """
+        Execute one parameterized statement for many parameter sets.
+        
+        SQLAlchemy hands the list to the driver's executemany, so values are
+        bound rather than pasted into the SQL text.
+        
+        Returns:
+            Number of parameter sets executed
+        """
+        if self.mock_mode:
+            self.logger.info("Mock executemany", query=query[:100], rows=len(rows))
+            return 0
+        
+        if not rows:
+            return 0
+        
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text(query), rows)
+                conn.commit()
+                return len(rows)
+        except Exception as e:
+            self.logger.error("Batch execution failed", query=query, error=str(e))
+            raise
+    
+    def bulk_load_csv(self, csv_path: str, database: str, schema: str, table: str, columns: list) -> int:
+        """
+        Load a local gzipped CSV into a table through the table's own stage.
+        
+        PUT uploads the file to @%table and COPY INTO loads it server-side, which
+        is far cheaper than multi-row INSERTs for large result sets. NULLs must be
+        written as \\N; empty fields load as empty strings.
+        
+        Returns:
+            Number of rows loaded
+        """
+        if self.mock_mode:
+            self.logger.info("Mock bulk load", table=f"{database}.{schema}.{table}")
+            return 0
+        
+        stage = f"@{database}.{schema}.%{table}"
+        file_url = "file://" + Path(csv_path).resolve().as_posix()
+        put_sql = f"PUT '{file_url}' {stage} AUTO_COMPRESS=FALSE OVERWRITE=TRUE"
+        copy_sql = f"""
+        COPY INTO {database}.{schema}.{table} ({', '.join(columns)})
+        FROM {stage}
+        FILES = ('{Path(csv_path).name}')
+        FILE_FORMAT = (
+            TYPE = CSV
+            COMPRESSION = GZIP
+            FIELD_OPTIONALLY_ENCLOSED_BY = '"'
+            EMPTY_FIELD_AS_NULL = FALSE
+            NULL_IF = ('\\\\N')
+        )
+        ON_ERROR = ABORT_STATEMENT
+        PURGE = TRUE
+        """
+        
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text(put_sql))
+                result = conn.execute(text(copy_sql))
+                loaded = sum(row._mapping.get("rows_loaded", 0) or 0 for row in result.fetchall())
+                conn.commit()
+                return loaded
+        except Exception as e:
+            self.logger.error("Bulk load failed", table=f"{database}.{schema}.{table}", error=str(e))
+            raise
+    
     def test_connection(self) -> bool:
         """Test database connection."""
         if self.mock_mode:
@@ -242,6 +370,11 @@ class DatabaseManager:
             self.logger.error("Database connection test failed", error=str(e))
             return False
     
+    def close(self) -> None:
+        """Close the pooled connections; the shared engine reconnects on next use."""
+        if not self.mock_mode:
+            self.engine.dispose()
+    
     def get_legacy_connection(self):
         """Get legacy SnowflakeConnection instance if using legacy mode."""
         if self.settings.POC:
@@ -69,46 +69,40 @@ class SnowflakeConnection:
             return None
 
     def find_view_in_schemas(self, view_name: str) -> str:
-        """Find which schema contains the view."""
+        """Find which schema contains the view, preferring CPS_DSCI_API."""
         if not self.engine:
             self.create_connection()
             
-        # First check CPS_DSCI_API
+        # One probe across all schemas instead of CPS_DSCI_API first, then the rest
         try:
-            sql = f"""
-            SELECT table_schema 
-            FROM information_schema.views 
-            WHERE table_name = '{view_name}' 
-            AND table_schema = 'CPS_DSCI_API'
-            """
-            
-            with self.engine.connect() as connection:
-                result = pd.read_sql(text(sql), connection)
-            
-            if not result.empty:
-                return 'CPS_DSCI_API'
-                
-        except Exception:
-            pass
-        
-        # If not found, check all schemas
-        try:
-            sql = f"""
+            sql = """
             SELECT table_schema 
             FROM information_schema.views 
-            WHERE table_name = '{view_name}'
+            WHERE table_name = :view_name
+            ORDER BY CASE WHEN table_schema = 'CPS_DSCI_API' THEN 0 ELSE 1 END
+            LIMIT 1
             """
             
             with self.engine.connect() as connection:
-                result = pd.read_sql(text(sql), connection)
+                result = pd.read_sql(text(sql), connection, params={'view_name': view_name})
             
             if not result.empty:
-                return result.iloc[0]['table_schema']
+                return result.iloc[0, 0]
                 
         except Exception:
             pass
             
         return None
+    
+    def get_view_ddls(self, view_names: list) -> tuple:
+        """Get DDL for many views, plus the names confirmed not to exist."""
+        if not self.engine:
+            self.create_connection()
+        
+        # Imported here: the analysis package imports this module
+        from api.core.analysis import fetch_view_ddls
+        return fetch_view_ddls(self.engine, view_names)
+
     def get_qualified_ddl(self, view_name: str) -> str:
         """Get DDL with proper schema qualification."""
         schema = self.find_view_in_schemas(view_name)
@@ -55,6 +55,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.error("Error during background executor shutdown", error=str(e))
     
+    # Stop the DDL parse worker processes (only started when ANALYSIS_PARSE_PROCESSES > 0)
+    try:
+        from api.core.analysis import shutdown_parse_pool
+        shutdown_parse_pool()
+        logger.info("DDL parse pool shutdown complete")
+    except Exception as e:
+        logger.error("Error during DDL parse pool shutdown", error=str(e))
+    
     logger.info("Shutting down Column Lineage API")
 
 
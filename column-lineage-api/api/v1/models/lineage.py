@@ -126,6 +126,10 @@ class LineageAnalysisRequest(BaseModel):
         default=True, 
         description="Include additional metadata in results"
     )
+    force_refresh: bool = Field(
+        default=False,
+        description="Ignore cached view DDLs and fetch them again"
+    )
 
 
 class LineageAnalysisJob(BaseModel):
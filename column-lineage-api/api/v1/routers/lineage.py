@@ -1,10 +1,12 @@
 """Column lineage API endpoints."""
 
+import asyncio
+import hashlib
 from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Response
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Header, Response
 from fastapi.responses import StreamingResponse
 
 from api.core.logging import get_logger
@@ -90,12 +92,24 @@ async def start_lineage_analysis(
         )
 
 
+def _job_status_etag(job: LineageAnalysisJob) -> str:
+    """Weak ETag over the job fields that change while it runs."""
+    state = (
+        job.status, job.started_at, job.completed_at, job.total_views,
+        job.processed_views, job.successful_views, job.failed_views,
+        job.results_count, job.error_message,
+    )
+    return f'W/"{hashlib.sha1(repr(state).encode()).hexdigest()[:16]}"'
+
+
 @router.get("/status/{job_id}", response_model=LineageAnalysisJob)
 async def get_job_status(
     job_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
     current_user: User = Depends(get_current_active_user),
 ):
-    """Get lineage analysis job status."""
+    """Get lineage analysis job status; answers 304 when If-None-Match is current."""
     logger.info("Getting job status", job_id=str(job_id), user_id=current_user.id)
     
     job = job_manager.get_job(job_id)
@@ -105,9 +119,64 @@ async def get_job_status(
             detail="Job not found",
         )
     
+    # Pollers resend the last ETag; skip serializing an unchanged job
+    etag = _job_status_etag(job)
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    response.headers["ETag"] = etag
     return job
 
 
+_TERMINAL_JOB_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+JOB_EVENTS_INTERVAL_SECONDS = 0.5
+# Comment line sent while the job is quiet, well inside client read timeouts
+# and proxy idle limits
+JOB_EVENTS_KEEPALIVE_SECONDS = 15.0
+
+
+@router.get("/events/{job_id}")
+async def stream_job_events(
+    job_id: UUID,
+    current_user: User = Depends(get_current_active_user),
+):
+    """Stream job status as server-sent events until the job finishes."""
+    logger.info("Subscribing to job events", job_id=str(job_id), user_id=current_user.id)
+    
+    if not job_manager.get_job(job_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found",
+        )
+    
+    async def event_stream():
+        # Same change detection as the status ETag; only push when the job moved
+        loop = asyncio.get_running_loop()
+        last_etag = None
+        last_sent = loop.time()
+        while True:
+            job = job_manager.get_job(job_id)
+            if not job:
+                return
+            etag = _job_status_etag(job)
+            if etag != last_etag:
+                last_etag = etag
+                last_sent = loop.time()
+                yield f"data: {job.model_dump_json()}\n\n"
+            elif loop.time() - last_sent >= JOB_EVENTS_KEEPALIVE_SECONDS:
+                last_sent = loop.time()
+                yield ": keep-alive\n\n"
+            if job.status in _TERMINAL_JOB_STATUSES:
+                return
+            await asyncio.sleep(JOB_EVENTS_INTERVAL_SECONDS)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/results/{job_id}", response_model=LineageResultsResponse)
 async def get_lineage_results(
     job_id: UUID,
@@ -342,8 +411,8 @@ async def export_lineage_results(
                 if r.confidence_score >= export_request.filter_by_confidence
             ]
         
-        # Generate export
-        export_data = await lineage_service.export_results(
+        # Generate export (async generator, consumed by StreamingResponse)
+        export_data = lineage_service.export_results(
             results, 
             export_request.format,
             include_metadata=export_request.include_metadata,
@@ -1026,7 +1095,7 @@ async def list_saved_results(
         
         # Get all CSV files in the results directory
         csv_files = []
-        for file_path in results_dir.glob("lineage_analysis_*.csv"):
+        for file_path in results_dir.glob("lineage_analysis_*.csv*"):
             stat = file_path.stat()
             csv_files.append({
                 "filename": file_path.name,
@@ -1070,7 +1139,7 @@ async def list_saved_results_public():
         
         # Get all CSV files in the results directory
         csv_files = []
-        for file_path in results_dir.glob("lineage_analysis_*.csv"):
+        for file_path in results_dir.glob("lineage_analysis_*.csv*"):
             stat = file_path.stat()
             csv_files.append({
                 "filename": file_path.name,
@@ -1294,7 +1363,7 @@ async def list_saved_results_public():
         
         # Get all CSV files in the results directory
         csv_files = []
-        for file_path in results_dir.glob("lineage_analysis_*.csv"):
+        for file_path in results_dir.glob("lineage_analysis_*.csv*"):
             stat = file_path.stat()
             csv_files.append({
                 "filename": file_path.name,
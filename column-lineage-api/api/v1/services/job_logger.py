@@ -11,6 +11,12 @@ import structlog
 
 from api.core.config import get_settings
 
+# Formatters are stateless and thread-safe, so every job file handler shares one
+_JOB_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
 
 class JobLogger:
     """Job-specific logger that writes to separate log files."""
@@ -51,13 +57,7 @@ class JobLogger:
         # Create file handler
         file_handler = logging.FileHandler(self.log_file_path, mode='w', encoding='utf-8')
         file_handler.setLevel(getattr(logging, self.log_level.upper()))
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_JOB_FORMATTER)
         
         # Add handler to logger
         logger.addHandler(file_handler)
@@ -1,13 +1,28 @@
 """Column lineage analysis service."""
 
-import io
-import json
+import asyncio
 import csv
+import functools
+import gzip
+import io
+import itertools
+import operator
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional, Dict, Any, AsyncGenerator
+from typing import (
+    List, Optional, Dict, Any, AsyncGenerator, Awaitable, Callable, Concatenate, Iterator,
+    ParamSpec, TypeVar, Union,
+)
 from uuid import UUID
 
-import pandas as pd
+import orjson
+import xlsxwriter
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
 
 from api.core.logging import LoggerMixin
 from api.dependencies.database import DatabaseManager, get_database_engine
@@ -19,15 +34,231 @@ from api.v1.models.lineage import (
     ExpressionType,
 )
 from api.v1.services.job_manager import JobManager
-from api.core.analysis import process_all_views, save_results_to_csv, get_analysis_summary
+from api.core.analysis import process_all_views, ProcessResult, save_results_to_csv, get_analysis_summary, clear_ddl_cache
 from api.core.config import get_settings
 
+# Unquoted Snowflake identifier; database names are interpolated into FROM clauses
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_$]*$")
+
+
+def _check_identifier(name: str, kind: str) -> str:
+    """Reject anything that isn't a plain identifier before it reaches SQL text."""
+    if not _IDENTIFIER_RE.match(name or ""):
+        raise ValueError(f"Invalid {kind} name: {name}")
+    return name
+
+
+_SCHEMAS_SQL = """
+SELECT SCHEMA_NAME
+FROM {prefix}INFORMATION_SCHEMA.SCHEMATA
+WHERE CATALOG_NAME = :database_filter
+ORDER BY SCHEMA_NAME
+"""
+
+_VIEWS_WITH_COUNTS_SQL = """
+SELECT 
+    v.TABLE_NAME as view_name,
+    v.TABLE_SCHEMA as schema_name,
+    v.TABLE_CATALOG as database_name,
+    v.CREATED as created_date,
+    v.LAST_ALTERED as last_modified,
+    COALESCE(c.column_count, 0) as column_count
+FROM {prefix}INFORMATION_SCHEMA.VIEWS v
+LEFT JOIN (
+    SELECT TABLE_SCHEMA, TABLE_NAME, COUNT(*) as column_count
+    FROM {prefix}INFORMATION_SCHEMA.COLUMNS
+    WHERE TABLE_CATALOG = :database_filter
+    AND TABLE_SCHEMA = :schema_filter
+    GROUP BY TABLE_SCHEMA, TABLE_NAME
+) c
+    ON c.TABLE_SCHEMA = v.TABLE_SCHEMA
+    AND c.TABLE_NAME = v.TABLE_NAME
+WHERE v.TABLE_CATALOG = :database_filter
+AND v.TABLE_SCHEMA = :schema_filter
+ORDER BY v.TABLE_NAME
+"""
+
+
+@functools.lru_cache(maxsize=128)
+def _schemas_query(database_filter: Optional[str] = None) -> TextClause:
+    """SCHEMATA query for one database (or the session's current one), parsed once."""
+    prefix = f"{_check_identifier(database_filter, 'database')}." if database_filter else ""
+    return text(_SCHEMAS_SQL.format(prefix=prefix))
+
+
+@functools.lru_cache(maxsize=128)
+def _views_with_counts_query(database_filter: Optional[str] = None) -> TextClause:
+    """VIEWS + column-count query for one database (or the current one), parsed once."""
+    prefix = f"{_check_identifier(database_filter, 'database')}." if database_filter else ""
+    return text(_VIEWS_WITH_COUNTS_SQL.format(prefix=prefix))
+
+
+# Job progress is written every N processed views or T seconds, whichever comes first
+_PROGRESS_EVERY_VIEWS = 25
+_PROGRESS_EVERY_SECONDS = 1.0
+
+# Enum member -> export string, so export loops skip per-row .value lookups
+_COLUMN_TYPE_VALUES = {ct: ct.value for ct in ColumnType}
+_EXPRESSION_TYPE_VALUES: Dict[Optional[ExpressionType], str] = {et: et.value for et in ExpressionType}
+_EXPRESSION_TYPE_VALUES[None] = ""
+
+# Blocking DB calls share one bounded pool sized to the engine's default
+# QueuePool capacity (pool_size=5 + max_overflow=10), so extra requests wait
+# here rather than on a checked-out connection
+_DB_QUERY_THREADS = 15
+_db_executor = ThreadPoolExecutor(max_workers=_DB_QUERY_THREADS, thread_name_prefix="lineage-db")
+
+# Column headers shared by the CSV and Excel exports
+_EXPORT_HEADER = (
+    "View_Name", "View_Column", "Column_Type",
+    "Source_Table", "Source_Column", "Expression_Type",
+    "Confidence_Score",
+)
+_EXPORT_HEADER_WITH_METADATA = _EXPORT_HEADER + ("Metadata",)
+
+# Columns of the auto-save lineage table loaded by both insert paths;
+# ANALYSIS_TIMESTAMP and CREATED_AT are left to their CURRENT_TIMESTAMP() defaults
+_LINEAGE_TABLE_COLUMNS = (
+    "VIEW_NAME", "VIEW_COLUMN", "COLUMN_TYPE", "SOURCE_TABLE", "SOURCE_COLUMN",
+    "EXPRESSION_TYPE",
+)
+
+# Rows per chunk yielded by the streaming CSV export
+_EXPORT_BATCH_SIZE = 4096
+
+
+# Discovery results (databases, schemas, views) change rarely; reuse them briefly
+_DISCOVERY_CACHE_TTL_SECONDS = 300
+_DISCOVERY_CACHE_MAXSIZE = 256
+
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+def _ttl_cached(
+    method: Callable[Concatenate["LineageService", _P], Awaitable[List[_T]]],
+) -> Callable[Concatenate["LineageService", _P], Awaitable[List[_T]]]:
+    """Memoize an async discovery method per argument tuple for a short TTL."""
+    @functools.wraps(method)
+    async def wrapper(self: "LineageService", *args: _P.args, **kwargs: _P.kwargs) -> List[_T]:
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        cached = self._discovery_cache.get(key)
+        if cached and now - cached[0] < _DISCOVERY_CACHE_TTL_SECONDS:
+            return list(cached[1])
+        
+        result = await method(self, *args, **kwargs)
+        
+        if key not in self._discovery_cache and len(self._discovery_cache) >= _DISCOVERY_CACHE_MAXSIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            self._discovery_cache.pop(next(iter(self._discovery_cache)))
+        self._discovery_cache[key] = (now, result)
+        return list(result)
+    
+    return wrapper
+
+
+def _resolve_accessor(row, candidates: List[str], index: Optional[int] = 0) -> Callable[[Any], Any]:
+    """
+    Work out once how to read a column from result rows.
+    
+    Tries attribute names, then ``_mapping`` keys, then a positional index, on a
+    sample row; the returned getter is applied to every row without re-probing.
+    """
+    for name in candidates:
+        if hasattr(row, name):
+            return operator.attrgetter(name)
+    
+    mapping = getattr(row, '_mapping', None)
+    if mapping is not None:
+        for name in candidates:
+            if name in mapping:
+                return lambda r, name=name: r._mapping[name]
+    
+    if index is not None:
+        try:
+            row[index]
+            return operator.itemgetter(index)
+        except (IndexError, TypeError):
+            pass
+    
+    return lambda r: None
+
+
+def _metadata_dumper() -> Callable[[dict], str]:
+    """
+    Return a metadata-to-JSON function for one export pass.
+    
+    Converted results share one metadata dict per original expression type,
+    so the serialized string is memoized by dict identity and each distinct
+    dict is dumped only once. Results stay alive for the whole export, which
+    keeps the ids stable.
+    """
+    memo: Dict[int, str] = {}
+    
+    def dump(metadata: dict) -> str:
+        key = id(metadata)
+        text = memo.get(key)
+        if text is None:
+            text = memo[key] = orjson.dumps(metadata, default=str).decode()
+        return text
+    
+    return dump
+
+
+def _export_rows(results: List[ColumnLineageResult], include_metadata: bool) -> Iterator[tuple]:
+    """Yield one positional row per result, in _EXPORT_HEADER order."""
+    column_type_values = _COLUMN_TYPE_VALUES
+    expression_type_values = _EXPRESSION_TYPE_VALUES
+    if include_metadata:
+        dump_metadata = _metadata_dumper()
+        for r in results:
+            yield (r.view_name, r.view_column, column_type_values[r.column_type],
+                   r.source_table, r.source_column, expression_type_values[r.expression_type],
+                   r.confidence_score, dump_metadata(r.metadata))
+    else:
+        for r in results:
+            yield (r.view_name, r.view_column, column_type_values[r.column_type],
+                   r.source_table, r.source_column, expression_type_values[r.expression_type],
+                   r.confidence_score)
+
+
 class LineageService(LoggerMixin):
     """Column lineage analysis service."""
     
+    # Uppercase value -> ExpressionType; unknown strings (incl. 'ERROR') map to None
+    _EXPR_TYPE_MAP = {e.value: e for e in ExpressionType}
+    
+    # Parser column type -> (ColumnType, confidence); anything else is (UNKNOWN, 0.5)
+    _COLUMN_TYPE_MAP = {
+        'DIRECT': (ColumnType.DIRECT, 1.0),
+        'DERIVED': (ColumnType.DERIVED, 0.8),
+        'ERROR': (ColumnType.UNKNOWN, 0.0),
+    }
+    
     def __init__(self):
         self.db_manager = DatabaseManager()
         self.job_manager = JobManager()
+        self._settings = get_settings()
+        # (method, args, kwargs) -> (cached_at, result) for discovery queries
+        self._discovery_cache: Dict[tuple, tuple] = {}
+    
+    def invalidate_discovery_cache(self) -> None:
+        """Forget cached database/schema/view listings so the next call queries again."""
+        self._discovery_cache.clear()
+    
+    async def _aquery(self, query: Union[str, TextClause], params: Optional[dict] = None):
+        """Run a blocking database query on the shared DB thread pool so the event loop stays free."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_db_executor, self.db_manager.execute_query, query, params)
+    
+    async def _ashow_query(self, show_statement: str, scan_query: str, params: Optional[dict] = None):
+        """Run a SHOW + RESULT_SCAN pair on the shared DB thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _db_executor, self.db_manager.execute_show_query, show_statement, scan_query, params
+        )
     
     def _blocking_lineage_analysis(
         self,
@@ -39,7 +270,6 @@ class LineageService(LoggerMixin):
         Blocking version of lineage analysis for thread pool execution.
         This runs in a separate thread to avoid blocking the main event loop.
         """
-        import asyncio
         from api.v1.services.job_logger import JobLoggerManager
         
         # Get job-specific logger
@@ -86,6 +316,11 @@ class LineageService(LoggerMixin):
             self.job_manager.update_job_status(job_id, "RUNNING", started_at=datetime.utcnow())
             job_logger.info("Job status updated to RUNNING")
             
+            if request.force_refresh:
+                clear_ddl_cache()
+                self.invalidate_discovery_cache()
+                job_logger.info("Cleared cached view DDLs and discovery results (force_refresh)")
+            
             # Get database engine for the standalone module
             engine = get_database_engine()
             job_logger.info("Database engine obtained")
@@ -105,7 +340,6 @@ class LineageService(LoggerMixin):
                     job_logger.info("Discovering available views from database")
                     
                     # Add timeout to prevent hanging
-                    import asyncio
                     all_views = await asyncio.wait_for(
                         self.get_available_views(
                             database_filter=request.database_filter or "CPS_DB",
@@ -145,7 +379,7 @@ class LineageService(LoggerMixin):
             
             # Process views using standalone module with progress tracking and timeout
             try:
-                csv_rows = await asyncio.wait_for(
+                outcome = await asyncio.wait_for(
                     asyncio.get_event_loop().run_in_executor(
                         None,  # Use default executor
                         self._process_views_with_logging,
@@ -159,16 +393,12 @@ class LineageService(LoggerMixin):
             
             # Convert CSV rows to API result format
             job_logger.info("Converting results to API format")
-            results = self._convert_csv_rows_to_api_results(csv_rows)
+            results = self._convert_csv_rows_to_api_results(outcome.csv_rows)
             job_logger.info(f"Converted {len(results)} results")
             
-            # Calculate successful and failed views from results
-            processed_view_names = set()
-            for result in results:
-                processed_view_names.add(result.view_name)
-            
-            successful_views = len(processed_view_names)
-            failed_views = max(0, total_views - successful_views)
+            # The analysis module already counted per-view outcomes
+            successful_views = outcome.successful_views
+            failed_views = outcome.failed_views
             
             job_logger.info(f"Analysis summary: {successful_views} successful, {failed_views} failed")
             
@@ -185,21 +415,26 @@ class LineageService(LoggerMixin):
             job_logger.info("Storing job results")
             self.job_manager.store_job_results(job_id, results)
             
-            # Auto-save results to CSV file
+            # Auto-save results to CSV file and database table; the two are
+            # independent, so run them side by side
             job_logger.info("Auto-saving results to CSV file")
-            await self._auto_save_results_to_csv(job_id, results)
+            auto_saves = [self._auto_save_results_to_csv(job_id, results)]
             
-            # Auto-save results to database table
             if request.database_filter and request.schema_filter:
                 job_logger.info("Auto-saving results to database table")
-                settings = get_settings()
-                target_database = settings.AUTO_SAVE_TARGET_DATABASE or request.database_filter
-                target_schema = settings.AUTO_SAVE_TARGET_SCHEMA or request.schema_filter
-                await self._auto_save_results_to_database(
+                target_database = self._settings.AUTO_SAVE_TARGET_DATABASE or request.database_filter
+                target_schema = self._settings.AUTO_SAVE_TARGET_SCHEMA or request.schema_filter
+                auto_saves.append(self._auto_save_results_to_database(
                     results, 
                     target_database, 
                     target_schema
-                )
+                ))
+            
+            # Both helpers log and swallow their own failures; return_exceptions
+            # keeps one from cancelling the other if that ever changes
+            for save_result in await asyncio.gather(*auto_saves, return_exceptions=True):
+                if isinstance(save_result, Exception):
+                    job_logger.error(f"Auto-save failed: {save_result}")
             
             # Update job completion
             self.job_manager.update_job_status(
@@ -231,23 +466,37 @@ class LineageService(LoggerMixin):
         job_id: UUID, 
         job_logger, 
         total_views: int
-    ) -> List[List[str]]:
+    ) -> ProcessResult:
         """Process views with detailed logging and progress tracking."""
         from api.core.analysis import process_all_views
         
         job_logger.info("Starting view processing with detailed logging")
         
-        # For now, use the existing process_all_views function
-        # In a future enhancement, we could modify this to provide per-view logging
+        # Coalesce progress writes: flush every N views or T seconds, not per view.
+        # The final count is written by the caller once processing returns.
+        last_flush = time.monotonic()
+        
+        def on_progress(processed: int, total: int) -> None:
+            nonlocal last_flush
+            now = time.monotonic()
+            if processed % _PROGRESS_EVERY_VIEWS and now - last_flush < _PROGRESS_EVERY_SECONDS:
+                return
+            last_flush = now
+            self.job_manager.update_job_progress(job_id, processed_views=processed)
+            job_logger.log_progress(processed, total, "Processing views")
+        
         try:
-            csv_rows = process_all_views(
+            outcome = process_all_views(
                 sf_env=sf_env,
                 view_names=view_names,
-                engine=engine
+                engine=engine,
+                max_workers=self._settings.ANALYSIS_WORKERS,
+                parse_processes=self._settings.ANALYSIS_PARSE_PROCESSES,
+                progress_callback=on_progress,
             )
             
-            job_logger.info(f"View processing completed, generated {len(csv_rows)} result rows")
-            return csv_rows
+            job_logger.info(f"View processing completed, generated {len(outcome.csv_rows)} result rows")
+            return outcome
             
         except Exception as e:
             job_logger.error(f"View processing failed: {str(e)}")
@@ -298,9 +547,26 @@ class LineageService(LoggerMixin):
         # Return empty list since this is async - results will be stored by the background task
         return []
     
+    def _map_expression_type(self, expression_type: str) -> Optional[ExpressionType]:
+        """Map a parser expression type string to ExpressionType, or None if unknown."""
+        return self._EXPR_TYPE_MAP.get(expression_type.upper()) if expression_type else None
+    
     def _convert_csv_rows_to_api_results(self, csv_rows: List[List[str]]) -> List[ColumnLineageResult]:
         """Convert CSV rows from standalone analysis to API result format."""
         results = []
+        append = results.append
+        column_type_map = self._COLUMN_TYPE_MAP
+        unknown = (ColumnType.UNKNOWN, 0.5)
+        map_expression_type = self._map_expression_type
+        # Metadata differs only by expression type, so rows share one dict per
+        # type and exports serialize each distinct dict once
+        metadata_by_type: Dict[str, dict] = {}
+        # Fields come straight from our own parser output and are already
+        # well-typed, so skip pydantic validation unless configured otherwise
+        if self._settings.TRUST_ANALYSIS_OUTPUT:
+            construct = ColumnLineageResult.model_construct
+        else:
+            construct = ColumnLineageResult
         
         for row in csv_rows:
             if len(row) < 6:
@@ -308,29 +574,17 @@ class LineageService(LoggerMixin):
                 
             view_name, view_column, column_type, source_table, source_column, expression_type = row[:6]
             
-            # Map column type
-            if column_type.upper() == 'DIRECT':
-                col_type = ColumnType.DIRECT
-                confidence = 1.0
-            elif column_type.upper() == 'DERIVED':
-                col_type = ColumnType.DERIVED
-                confidence = 0.8
-            elif column_type.upper() == 'ERROR':
-                col_type = ColumnType.UNKNOWN
-                confidence = 0.0
-            else:
-                col_type = ColumnType.UNKNOWN
-                confidence = 0.5
-            
-            # Map expression type
-            expr_type = None
-            if expression_type and expression_type.upper() not in ['', 'ERROR']:
-                try:
-                    expr_type = ExpressionType(expression_type.upper())
-                except ValueError:
-                    expr_type = None
+            # Map column type and expression type
+            col_type, confidence = column_type_map.get(column_type.upper(), unknown)
+            expr_type = map_expression_type(expression_type)
+            metadata = metadata_by_type.get(expression_type)
+            if metadata is None:
+                metadata = metadata_by_type[expression_type] = {
+                    "analysis_method": "standalone_integrated_parser",
+                    "original_expression_type": expression_type
+                }
             
-            result = ColumnLineageResult(
+            append(construct(
                 view_name=view_name,
                 view_column=view_column,
                 column_type=col_type,
@@ -338,15 +592,12 @@ class LineageService(LoggerMixin):
                 source_column=source_column,
                 expression_type=expr_type,
                 confidence_score=confidence,
-                metadata={
-                    "analysis_method": "standalone_integrated_parser",
-                    "original_expression_type": expression_type
-                }
-            )
-            results.append(result)
+                metadata=metadata,
+            ))
         
         return results
     
+    @_ttl_cached
     async def get_available_databases(self) -> List[str]:
         """Get list of available databases."""
         self.logger.info("Getting available databases")
@@ -358,38 +609,13 @@ class LineageService(LoggerMixin):
             ORDER BY DATABASE_NAME
             """
             
-            results = self.db_manager.execute_query(query)
+            results = await self._aquery(query)
             
-            # Handle different possible column name cases
+            # Resolve how to read the name column once, then apply it to every row
             databases = []
-            for row in results:
-                # Try different column name variations
-                db_name = None
-                for attr in ['DATABASE_NAME', 'database_name', 'Database_Name']:
-                    try:
-                        db_name = getattr(row, attr, None)
-                        if db_name:
-                            break
-                    except AttributeError:
-                        continue
-                
-                # If attribute access fails, try dictionary-style access
-                if not db_name and hasattr(row, '_mapping'):
-                    mapping = row._mapping
-                    for key in ['DATABASE_NAME', 'database_name', 'Database_Name']:
-                        if key in mapping:
-                            db_name = mapping[key]
-                            break
-                
-                # If still no luck, try index access (first column)
-                if not db_name:
-                    try:
-                        db_name = row[0]
-                    except (IndexError, TypeError):
-                        pass
-                
-                if db_name:
-                    databases.append(db_name)
+            if results:
+                get_name = _resolve_accessor(results[0], ['DATABASE_NAME', 'database_name', 'Database_Name'])
+                databases = [name for name in map(get_name, results) if name]
             
             self.logger.info(f"Found {len(databases)} databases: {databases}")
             return databases
@@ -398,7 +624,7 @@ class LineageService(LoggerMixin):
             self.logger.error("Failed to get available databases", error=str(e))
             # Log the actual row structure for debugging
             try:
-                results = self.db_manager.execute_query(query)
+                results = await self._aquery(query)
                 if results:
                     sample_row = results[0]
                     self.logger.error(f"Sample row structure: {dir(sample_row)}")
@@ -408,54 +634,23 @@ class LineageService(LoggerMixin):
                 self.logger.error(f"Debug query failed: {debug_error}")
             raise
 
+    @_ttl_cached
     async def get_available_schemas(self, database_filter: str) -> List[str]:
         """Get list of available schemas for a specific database."""
         self.logger.info("Getting available schemas", database_filter=database_filter)
         
+        query = _schemas_query(database_filter)
+        
         try:
-            # First, we need to switch to the target database context to query its schemas
-            # In Snowflake, we can query schemas from INFORMATION_SCHEMA.SCHEMATA
-            # but we need to specify the database context
-            query = f"""
-            SELECT SCHEMA_NAME
-            FROM {database_filter}.INFORMATION_SCHEMA.SCHEMATA
-            WHERE CATALOG_NAME = :database_filter
-            ORDER BY SCHEMA_NAME
-            """
-            
+            # Query the target database's own INFORMATION_SCHEMA.SCHEMATA
             params = {"database_filter": database_filter}
-            results = self.db_manager.execute_query(query, params)
+            results = await self._aquery(query, params)
             
-            # Handle different possible column name cases
+            # Resolve how to read the name column once, then apply it to every row
             schemas = []
-            for row in results:
-                # Try different column name variations
-                schema_name = None
-                for attr in ['SCHEMA_NAME', 'schema_name', 'Schema_Name']:
-                    try:
-                        schema_name = getattr(row, attr, None)
-                        if schema_name:
-                            break
-                    except AttributeError:
-                        continue
-                
-                # If attribute access fails, try dictionary-style access
-                if not schema_name and hasattr(row, '_mapping'):
-                    mapping = row._mapping
-                    for key in ['SCHEMA_NAME', 'schema_name', 'Schema_Name']:
-                        if key in mapping:
-                            schema_name = mapping[key]
-                            break
-                
-                # If still no luck, try index access (first column)
-                if not schema_name:
-                    try:
-                        schema_name = row[0]
-                    except (IndexError, TypeError):
-                        pass
-                
-                if schema_name:
-                    schemas.append(schema_name)
+            if results:
+                get_name = _resolve_accessor(results[0], ['SCHEMA_NAME', 'schema_name', 'Schema_Name'])
+                schemas = [name for name in map(get_name, results) if name]
             
             self.logger.info(f"Found {len(schemas)} schemas for database {database_filter}")
             return schemas
@@ -465,46 +660,15 @@ class LineageService(LoggerMixin):
             # Fallback: try without database prefix
             try:
                 self.logger.info("Trying fallback query without database prefix")
-                query = """
-                SELECT DISTINCT SCHEMA_NAME
-                FROM INFORMATION_SCHEMA.SCHEMATA
-                WHERE CATALOG_NAME = :database_filter
-                ORDER BY SCHEMA_NAME
-                """
+                query = _schemas_query()
                 
                 params = {"database_filter": database_filter}
-                results = self.db_manager.execute_query(query, params)
+                results = await self._aquery(query, params)
                 
-                # Handle different possible column name cases
                 schemas = []
-                for row in results:
-                    # Try different column name variations
-                    schema_name = None
-                    for attr in ['SCHEMA_NAME', 'schema_name', 'Schema_Name']:
-                        try:
-                            schema_name = getattr(row, attr, None)
-                            if schema_name:
-                                break
-                        except AttributeError:
-                            continue
-                    
-                    # If attribute access fails, try dictionary-style access
-                    if not schema_name and hasattr(row, '_mapping'):
-                        mapping = row._mapping
-                        for key in ['SCHEMA_NAME', 'schema_name', 'Schema_Name']:
-                            if key in mapping:
-                                schema_name = mapping[key]
-                                break
-                    
-                    # If still no luck, try index access (first column)
-                    if not schema_name:
-                        try:
-                            schema_name = row[0]
-                        except (IndexError, TypeError):
-                            pass
-                    
-                    if schema_name:
-                        schemas.append(schema_name)
+                if results:
+                    get_name = _resolve_accessor(results[0], ['SCHEMA_NAME', 'schema_name', 'Schema_Name'])
+                    schemas = [name for name in map(get_name, results) if name]
                 
                 self.logger.info(f"Found {len(schemas)} schemas for database {database_filter} (fallback)")
                 return schemas
@@ -513,6 +677,24 @@ class LineageService(LoggerMixin):
                 self.logger.error("Fallback query also failed", error=str(fallback_error))
                 raise
 
+    @staticmethod
+    def _rows_to_view_infos(rows) -> List[ViewInfo]:
+        """Build ViewInfo objects from INFORMATION_SCHEMA.VIEWS rows."""
+        # Snowflake returns Decimal counts and tz-aware timestamps, so these
+        # keep pydantic validation for its coercion
+        return [
+            ViewInfo(
+                view_name=row.view_name,
+                schema_name=row.schema_name,
+                database_name=row.database_name,
+                column_count=row.column_count,
+                created_date=row.created_date,
+                last_modified=row.last_modified,
+            )
+            for row in rows
+        ]
+    
+    @_ttl_cached
     async def get_available_views(
         self,
         schema_filter: str,  # Made mandatory
@@ -531,58 +713,19 @@ class LineageService(LoggerMixin):
             database_filter=database_filter,
         )
         
+        query = _views_with_counts_query(database_filter)
+        
         try:
-            # Query views from the specific database's INFORMATION_SCHEMA
-            query = f"""
-            SELECT 
-                TABLE_NAME as view_name,
-                TABLE_SCHEMA as schema_name,
-                TABLE_CATALOG as database_name,
-                CREATED as created_date,
-                LAST_ALTERED as last_modified
-            FROM {database_filter}.INFORMATION_SCHEMA.VIEWS
-            WHERE TABLE_CATALOG = :database_filter
-            AND TABLE_SCHEMA = :schema_filter
-            ORDER BY TABLE_NAME
-            """
-            
+            # Query views and their column counts from the specific database's
+            # INFORMATION_SCHEMA in a single round trip
             params = {
                 "schema_filter": schema_filter,
                 "database_filter": database_filter
             }
             
-            results = self.db_manager.execute_query(query, params)
+            results = await self._aquery(query, params)
             
-            views = []
-            for row in results:
-                # Get column count for each view from the specific database
-                col_count_query = f"""
-                SELECT COUNT(*) as column_count
-                FROM {database_filter}.INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_CATALOG = :database_name
-                AND TABLE_SCHEMA = :schema_name
-                AND TABLE_NAME = :view_name
-                """
-                
-                col_result = self.db_manager.execute_query(
-                    col_count_query,
-                    {
-                        "database_name": row.database_name,
-                        "schema_name": row.schema_name, 
-                        "view_name": row.view_name
-                    }
-                )
-                
-                column_count = col_result[0].column_count if col_result else 0
-                
-                views.append(ViewInfo(
-                    view_name=row.view_name,
-                    schema_name=row.schema_name,
-                    database_name=row.database_name,
-                    column_count=column_count,
-                    created_date=row.created_date,
-                    last_modified=row.last_modified,
-                ))
+            views = self._rows_to_view_infos(results)
             
             self.logger.info(f"Found {len(views)} views matching filters")
             return views
@@ -592,51 +735,11 @@ class LineageService(LoggerMixin):
             # Fallback: try without database prefix (for current database context)
             try:
                 self.logger.info("Trying fallback query without database prefix")
-                query = """
-                SELECT 
-                    TABLE_NAME as view_name,
-                    TABLE_SCHEMA as schema_name,
-                    TABLE_CATALOG as database_name,
-                    CREATED as created_date,
-                    LAST_ALTERED as last_modified
-                FROM INFORMATION_SCHEMA.VIEWS
-                WHERE TABLE_CATALOG = :database_filter
-                AND TABLE_SCHEMA = :schema_filter
-                ORDER BY TABLE_NAME
-                """
+                query = _views_with_counts_query()
                 
-                results = self.db_manager.execute_query(query, params)
+                results = await self._aquery(query, params)
                 
-                views = []
-                for row in results:
-                    # Get column count for each view
-                    col_count_query = """
-                    SELECT COUNT(*) as column_count
-                    FROM INFORMATION_SCHEMA.COLUMNS
-                    WHERE TABLE_CATALOG = :database_name
-                    AND TABLE_SCHEMA = :schema_name
-                    AND TABLE_NAME = :view_name
-                    """
-                    
-                    col_result = self.db_manager.execute_query(
-                        col_count_query,
-                        {
-                            "database_name": row.database_name,
-                            "schema_name": row.schema_name, 
-                            "view_name": row.view_name
-                        }
-                    )
-                    
-                    column_count = col_result[0].column_count if col_result else 0
-                    
-                    views.append(ViewInfo(
-                        view_name=row.view_name,
-                        schema_name=row.schema_name,
-                        database_name=row.database_name,
-                        column_count=column_count,
-                        created_date=row.created_date,
-                        last_modified=row.last_modified,
-                    ))
+                views = self._rows_to_view_infos(results)
                 
                 self.logger.info(f"Found {len(views)} views matching filters (fallback)")
                 return views
@@ -655,9 +758,11 @@ class LineageService(LoggerMixin):
         self.logger.info("Exporting results", format=format, count=len(results))
         
         if format.lower() == "csv":
-            yield await self._export_csv(results, include_metadata)
+            async for chunk in self._export_csv(results, include_metadata):
+                yield chunk
         elif format.lower() == "json":
-            yield await self._export_json(results, include_metadata)
+            async for chunk in self._export_json(results, include_metadata):
+                yield chunk
         elif format.lower() == "excel":
             yield await self._export_excel(results, include_metadata)
         else:
@@ -679,6 +784,23 @@ class LineageService(LoggerMixin):
             max_views=max_views
         )
         
+        # Database and schema names can't be bind parameters, so reject anything
+        # that isn't a plain identifier before it reaches the SQL text
+        _check_identifier(database_filter, "database")
+        _check_identifier(schema_filter, "schema")
+        
+        # SHOW VIEWS reads cached metadata and is much cheaper than scanning
+        # INFORMATION_SCHEMA.VIEWS on large catalogs
+        show_statement = f"SHOW VIEWS IN SCHEMA {database_filter}.{schema_filter}"
+        scan_query = """
+        SELECT 
+            "name" as view_name,
+            "schema_name" as schema_name,
+            "database_name" as database_name
+        FROM TABLE(RESULT_SCAN(LAST_QUERY_ID()))
+        WHERE 1 = 1
+        """
+        
         query = f"""
         SELECT 
             TABLE_NAME as view_name,
@@ -689,71 +811,53 @@ class LineageService(LoggerMixin):
         AND TABLE_SCHEMA = :schema_filter
         """
         
-        params = {
+        params: Dict[str, Any] = {
             "database_filter": database_filter,
             "schema_filter": schema_filter
         }
+        scan_params: Dict[str, Any] = {}
         
         if not include_system_views:
+            scan_query += """ AND "name" NOT LIKE 'CANVAS_%'"""
             query += " AND TABLE_NAME NOT LIKE 'CANVAS_%'"
         
+        scan_query += ' ORDER BY "name"'
         query += " ORDER BY TABLE_NAME"
         
         if max_views:
-            query += f" LIMIT {max_views}"
-        
-        self.logger.info("Executing view discovery query", query=query, params=params)
+            scan_query += " LIMIT :max_views"
+            query += " LIMIT :max_views"
+            scan_params["max_views"] = params["max_views"] = int(max_views)
         
         try:
-            results = self.db_manager.execute_query(query, params)
+            self.logger.info("Executing view discovery query", query=show_statement, params=scan_params)
+            try:
+                results = await self._ashow_query(show_statement, scan_query, scan_params)
+            except Exception as show_error:
+                self.logger.warning(
+                    "SHOW VIEWS failed, falling back to INFORMATION_SCHEMA",
+                    error=str(show_error),
+                )
+                self.logger.info("Executing view discovery query", query=query, params=params)
+                results = await self._aquery(query, params)
             self.logger.info(f"View discovery query returned {len(results)} results")
             
             views = []
+            if results:
+                # Resolve column accessors once from the first row
+                get_view = _resolve_accessor(results[0], ['view_name', 'TABLE_NAME'])
+                get_schema = _resolve_accessor(results[0], ['schema_name', 'TABLE_SCHEMA'], index=None)
+                get_database = _resolve_accessor(results[0], ['database_name', 'TABLE_CATALOG'], index=None)
+            
             for i, row in enumerate(results):
                 self.logger.debug(f"Processing row {i}: {row}")
-                
-                # Handle different column name cases
-                view_name = None
-                schema_name = None
-                database_name = None
-                
-                # Try different attribute access methods
-                for attr in ['view_name', 'TABLE_NAME']:
-                    try:
-                        view_name = getattr(row, attr, None)
-                        if view_name:
-                            break
-                    except AttributeError:
-                        continue
-                
-                for attr in ['schema_name', 'TABLE_SCHEMA']:
-                    try:
-                        schema_name = getattr(row, attr, None)
-                        if schema_name:
-                            break
-                    except AttributeError:
-                        continue
-                
-                for attr in ['database_name', 'TABLE_CATALOG']:
-                    try:
-                        database_name = getattr(row, attr, None)
-                        if database_name:
-                            break
-                    except AttributeError:
-                        continue
-                
-                # Fallback to index access
-                if not view_name:
-                    try:
-                        view_name = row[0]
-                    except (IndexError, TypeError):
-                        pass
+                view_name = get_view(row)
                 
                 if view_name:
-                    view_info = ViewInfo(
+                    view_info = ViewInfo.model_construct(
                         view_name=view_name,
-                        schema_name=schema_name or schema_filter,
-                        database_name=database_name or database_filter,
+                        schema_name=get_schema(row) or schema_filter,
+                        database_name=get_database(row) or database_filter,
                         column_count=0,  # Will be populated later if needed
                     )
                     views.append(view_info)
@@ -768,163 +872,95 @@ class LineageService(LoggerMixin):
             self.logger.error("Failed to discover views", error=str(e))
             raise
     
-    async def _get_view_ddl(self, view_name: str, database_name: str = None, schema_name: str = None) -> Optional[str]:
-        """Get DDL for a specific view."""
-        try:
-            self.logger.info("Getting DDL for view", view_name=view_name, database_name=database_name, schema_name=schema_name)
-            
-            # Try with full qualification first if we have database and schema
-            if database_name and schema_name:
-                try:
-                    qualified_name = f"{database_name}.{schema_name}.{view_name}"
-                    query = f"SELECT GET_DDL('VIEW', '{qualified_name}') as ddl"
-                    self.logger.debug("Trying fully qualified DDL query", query=query)
-                    result = self.db_manager.execute_query(query)
-                    
-                    if result and len(result) > 0:
-                        ddl = getattr(result[0], 'ddl', result[0][0] if len(result[0]) > 0 else None)
-                        if ddl:
-                            self.logger.info("Successfully retrieved DDL with full qualification")
-                            return ddl
-                except Exception as e:
-                    self.logger.warning("Failed to get DDL with full qualification", error=str(e))
-            
-            # Try with schema qualification only
-            if schema_name:
-                try:
-                    qualified_name = f"{schema_name}.{view_name}"
-                    query = f"SELECT GET_DDL('VIEW', '{qualified_name}') as ddl"
-                    self.logger.debug("Trying schema qualified DDL query", query=query)
-                    result = self.db_manager.execute_query(query)
-                    
-                    if result and len(result) > 0:
-                        ddl = getattr(result[0], 'ddl', result[0][0] if len(result[0]) > 0 else None)
-                        if ddl:
-                            self.logger.info("Successfully retrieved DDL with schema qualification")
-                            return ddl
-                except Exception as e:
-                    self.logger.warning("Failed to get DDL with schema qualification", error=str(e))
-            
-            # Try without schema qualification
-            try:
-                query = f"SELECT GET_DDL('VIEW', '{view_name}') as ddl"
-                self.logger.debug("Trying unqualified DDL query", query=query)
-                result = self.db_manager.execute_query(query)
-                
-                if result and len(result) > 0:
-                    ddl = getattr(result[0], 'ddl', result[0][0] if len(result[0]) > 0 else None)
-                    if ddl:
-                        self.logger.info("Successfully retrieved DDL without qualification")
-                        return ddl
-            except Exception as e:
-                self.logger.warning("Failed to get DDL without qualification", error=str(e))
-            
-            # If all attempts failed, log and return None
-            self.logger.error(
-                "Could not retrieve DDL for view after all attempts", 
-                view_name=view_name,
-                database_name=database_name,
-                schema_name=schema_name
-            )
-            return None
-            
-        except Exception as e:
-            self.logger.error("Failed to get DDL", view_name=view_name, error=str(e))
-            return None
-    
     async def _export_csv(
         self, 
         results: List[ColumnLineageResult], 
         include_metadata: bool
-    ) -> bytes:
-        """Export results as CSV."""
+    ) -> AsyncGenerator[bytes, None]:
+        """Export results as CSV, yielding one chunk per batch of rows."""
         output = io.StringIO()
         
-        fieldnames = [
-            "View_Name", "View_Column", "Column_Type",
-            "Source_Table", "Source_Column", "Expression_Type",
-            "Confidence_Score"
-        ]
-        
-        if include_metadata:
-            fieldnames.append("Metadata")
+        fieldnames = _EXPORT_HEADER_WITH_METADATA if include_metadata else _EXPORT_HEADER
         
-        writer = csv.DictWriter(output, fieldnames=fieldnames)
-        writer.writeheader()
+        # Positional rows through the C csv.writer; no per-row dict as with DictWriter
+        writer = csv.writer(output)
+        writer.writerow(fieldnames)
+        rows = _export_rows(results, include_metadata)
         
-        for result in results:
-            row = {
-                "View_Name": result.view_name,
-                "View_Column": result.view_column,
-                "Column_Type": result.column_type.value,
-                "Source_Table": result.source_table,
-                "Source_Column": result.source_column,
-                "Expression_Type": result.expression_type.value if result.expression_type else "",
-                "Confidence_Score": result.confidence_score,
-            }
-            
-            if include_metadata:
-                row["Metadata"] = json.dumps(result.metadata)
-            
-            writer.writerow(row)
+        for _ in range(0, len(results), _EXPORT_BATCH_SIZE):
+            writer.writerows(itertools.islice(rows, _EXPORT_BATCH_SIZE))
+            yield output.getvalue().encode("utf-8")
+            output.seek(0)
+            output.truncate(0)
         
-        return output.getvalue().encode("utf-8")
+        if output.tell():
+            yield output.getvalue().encode("utf-8")
     
     async def _export_json(
         self, 
         results: List[ColumnLineageResult], 
         include_metadata: bool
-    ) -> bytes:
-        """Export results as JSON."""
-        data = []
-        for result in results:
-            item = result.model_dump()
-            if not include_metadata:
-                item.pop("metadata", None)
-            data.append(item)
-        
-        return json.dumps(data, indent=2, default=str).encode("utf-8")
+    ) -> AsyncGenerator[bytes, None]:
+        """Export results as a JSON array, yielding one chunk per item."""
+        # Exclude metadata at dump time rather than copying it and popping it.
+        # orjson encodes enums, datetimes and UUIDs natively, so a python-mode
+        # dump avoids pydantic's separate JSON-mode conversion pass.
+        exclude = None if include_metadata else {"metadata"}
+        yield b"["
+        for index, result in enumerate(results):
+            if index:
+                yield b","
+            yield orjson.dumps(result.model_dump(exclude=exclude), default=str)
+        yield b"]"
     
     async def _export_excel(
         self, 
         results: List[ColumnLineageResult], 
         include_metadata: bool
     ) -> bytes:
-        """Export results as Excel."""
-        # Convert to DataFrame
-        data = []
-        for result in results:
-            row = {
-                "View_Name": result.view_name,
-                "View_Column": result.view_column,
-                "Column_Type": result.column_type.value,
-                "Source_Table": result.source_table,
-                "Source_Column": result.source_column,
-                "Expression_Type": result.expression_type.value if result.expression_type else "",
-                "Confidence_Score": result.confidence_score,
-            }
-            
-            if include_metadata:
-                row["Metadata"] = json.dumps(result.metadata)
-            
-            data.append(row)
+        """Export results as Excel, writing rows straight through xlsxwriter."""
+        # constant_memory flushes each row to a temp file once the next one
+        # starts, so memory stays flat regardless of result count. Rows have
+        # to be written in order for that, which is why pandas isn't used.
+        columns = _EXPORT_HEADER_WITH_METADATA if include_metadata else _EXPORT_HEADER
         
-        df = pd.DataFrame(data)
-        
-        # Write to Excel
         output = io.BytesIO()
-        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="Column_Lineage", index=False)
+        workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+        worksheet = workbook.add_worksheet("Column_Lineage")
+        worksheet.write_row(0, 0, columns, workbook.add_format({"bold": True}))
+        
+        for row_index, row in enumerate(_export_rows(results, include_metadata), 1):
+            worksheet.write_row(row_index, 0, row)
         
+        workbook.close()
         return output.getvalue()
     
+    @staticmethod
+    def _stream_csv_to_file(
+        results: List[ColumnLineageResult], filepath, include_metadata: bool, compress: bool = False
+    ) -> int:
+        """Write results as CSV directly to a file; returns the file size in bytes."""
+        # One pass through csv.writer into a 1 MiB buffered handle, with no
+        # intermediate string or bytes copies of the whole export
+        with open(filepath, 'wb', buffering=1 << 20) as raw:
+            # Level 1 costs little CPU and still shrinks the repetitive lineage text several-fold
+            sink = gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=1) if compress else raw
+            f = io.TextIOWrapper(sink, encoding='utf-8', newline='')
+            writer = csv.writer(f)
+            writer.writerow(_EXPORT_HEADER_WITH_METADATA if include_metadata else _EXPORT_HEADER)
+            writer.writerows(_export_rows(results, include_metadata))
+            f.flush()
+            f.detach()
+            if compress:
+                sink.close()  # writes the gzip trailer; raw stays open
+            return raw.tell()
+    
     async def _auto_save_results_to_csv(self, job_id: UUID, results: List[ColumnLineageResult]) -> None:
         """Auto-save analysis results to CSV file when job completes."""
         try:
-            from api.core.config import get_settings
             from pathlib import Path
             
-            settings = get_settings()
+            settings = self._settings
             
             # Check if auto-save is enabled
             if not settings.AUTO_SAVE_RESULTS:
@@ -938,23 +974,23 @@ class LineageService(LoggerMixin):
             # Generate filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"lineage_analysis_{str(job_id)[:8]}_{timestamp}.csv"
+            if settings.AUTO_SAVE_COMPRESS:
+                filename += ".gz"
             filepath = results_dir / filename
             
             self.logger.info("Auto-saving results to CSV", job_id=str(job_id), filepath=str(filepath))
             
-            # Generate CSV content
-            csv_content = await self._export_csv(results, include_metadata=True)
-            
-            # Write to file
-            with open(filepath, 'wb') as f:
-                f.write(csv_content)
+            # Write rows straight into the file off the event loop
+            file_size_bytes = await asyncio.to_thread(
+                self._stream_csv_to_file, results, filepath, True, settings.AUTO_SAVE_COMPRESS
+            )
             
             self.logger.info(
                 "Results auto-saved successfully", 
                 job_id=str(job_id), 
                 filepath=str(filepath),
                 results_count=len(results),
-                file_size_bytes=len(csv_content)
+                file_size_bytes=file_size_bytes
             )
             
         except Exception as e:
@@ -969,9 +1005,7 @@ class LineageService(LoggerMixin):
     ) -> None:
         """Auto-save analysis results to Snowflake table in the same database and schema."""
         try:
-            from api.core.config import get_settings
-            
-            settings = get_settings()
+            settings = self._settings
             
             # Check if database auto-save is enabled
             if not settings.AUTO_SAVE_TO_DATABASE:
@@ -984,6 +1018,11 @@ class LineageService(LoggerMixin):
             
             # Table name for storing lineage results
             table_name = settings.AUTO_SAVE_TARGET_TABLE
+            # Every statement below interpolates these names, so reject anything
+            # that is not a plain identifier once, up front; row values are bound
+            _check_identifier(database_name, "database")
+            _check_identifier(schema_name, "schema")
+            _check_identifier(table_name, "table")
             full_table_name = f"{database_name}.{schema_name}.{table_name}"
             
             self.logger.info(
@@ -1027,7 +1066,7 @@ class LineageService(LoggerMixin):
             """
             
             self.logger.debug("Creating lineage results table", sql=create_table_sql)
-            self.db_manager.execute_query(create_table_sql)
+            await self._aquery(create_table_sql)
             
             self.logger.info("Lineage results table created/verified", table_name=full_table_name)
             
@@ -1052,49 +1091,20 @@ class LineageService(LoggerMixin):
             
             # Execute truncate with explicit transaction handling
             try:
-                self.db_manager.execute_query(truncate_sql)
+                await self._aquery(truncate_sql)
                 self.logger.info("Table truncated successfully", table_name=full_table_name)
             except Exception as truncate_error:
                 self.logger.error("Failed to truncate table", table_name=full_table_name, error=str(truncate_error))
                 raise
             
-            # Prepare batch insert data
-            insert_data = []
-            for result in results:
-                insert_data.append({
-                    'view_name': result.view_name,
-                    'view_column': result.view_column,
-                    'column_type': result.column_type.value,
-                    'source_table': result.source_table,
-                    'source_column': result.source_column,
-                    'expression_type': result.expression_type.value if result.expression_type else None
-                })
-            
-            # Insert in batches to avoid query size limits
-            batch_size = 100
-            total_inserted = 0
-            
-            for i in range(0, len(insert_data), batch_size):
-                batch = insert_data[i:i + batch_size]
-                
-                # Build VALUES clause for batch insert
-                values_clauses = []
-                current_timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
-                
-                for row in batch:
-                    expression_type = f"'{row['expression_type']}'" if row['expression_type'] else "NULL"
-                    values_clause = f"('{row['view_name']}', '{row['view_column']}', '{row['column_type']}', '{row['source_table']}', '{row['source_column']}', {expression_type}, '{current_timestamp}', '{current_timestamp}')"
-                    values_clauses.append(values_clause)
-                
-                insert_sql = f"""
-                INSERT INTO {full_table_name} 
-                (VIEW_NAME, VIEW_COLUMN, COLUMN_TYPE, SOURCE_TABLE, SOURCE_COLUMN, EXPRESSION_TYPE, ANALYSIS_TIMESTAMP, CREATED_AT)
-                VALUES {', '.join(values_clauses)}
-                """
-                
-                self.logger.debug(f"Inserting batch {i//batch_size + 1}", batch_size=len(batch))
-                self.db_manager.execute_query(insert_sql)
-                total_inserted += len(batch)
+            # Stage a gzipped CSV and COPY it in, rather than building
+            # 100-row INSERT ... VALUES statements by string concatenation
+            loop = asyncio.get_running_loop()
+            total_inserted = await loop.run_in_executor(
+                _db_executor,
+                self._bulk_load_lineage_results,
+                results, database_name, schema_name, table_name,
+            )
             
             self.logger.info(
                 "Lineage results inserted successfully", 
@@ -1104,4 +1114,82 @@ class LineageService(LoggerMixin):
             
         except Exception as e:
             self.logger.error("Failed to insert lineage results", error=str(e))
-            raise
\ No newline at end of file
+            raise
+    
+    def _bulk_load_lineage_results(
+        self,
+        results: List[ColumnLineageResult],
+        database_name: str,
+        schema_name: str,
+        table_name: str,
+    ) -> int:
+        """
+        Bulk load results through a staged gzipped CSV, falling back to a
+        parameterized executemany INSERT if the stage load is not permitted.
+        """
+        try:
+            return self._stage_load_lineage_results(
+                results, database_name, schema_name, table_name
+            )
+        except Exception as e:
+            self.logger.warning(
+                "Stage load failed, falling back to batched INSERT", error=str(e)
+            )
+        
+        column_type_values = _COLUMN_TYPE_VALUES
+        expression_type_values = {**_EXPRESSION_TYPE_VALUES, None: None}
+        insert_sql = f"""
+        INSERT INTO {database_name}.{schema_name}.{table_name}
+        ({', '.join(_LINEAGE_TABLE_COLUMNS)})
+        VALUES (:view_name, :view_column, :column_type, :source_table, :source_column,
+                :expression_type)
+        """
+        # Bound the parameter list held per call; the statement text is the same
+        # for every batch, so batch size only affects memory and round trips
+        batch_size = max(1, self._settings.AUTO_SAVE_BATCH_SIZE)
+        total_inserted = 0
+        for start in range(0, len(results), batch_size):
+            rows = [
+                {
+                    "view_name": r.view_name,
+                    "view_column": r.view_column,
+                    "column_type": column_type_values[r.column_type],
+                    "source_table": r.source_table,
+                    "source_column": r.source_column,
+                    "expression_type": expression_type_values[r.expression_type],
+                }
+                for r in results[start:start + batch_size]
+            ]
+            total_inserted += self.db_manager.execute_many(insert_sql, rows)
+        return total_inserted
+    
+    def _stage_load_lineage_results(
+        self,
+        results: List[ColumnLineageResult],
+        database_name: str,
+        schema_name: str,
+        table_name: str,
+    ) -> int:
+        """Write results to a temporary gzipped CSV and bulk load it into the table."""
+        column_type_values = _COLUMN_TYPE_VALUES
+        # \N is the COPY NULL marker; expression_type is the only nullable column
+        expression_type_values = {**_EXPRESSION_TYPE_VALUES, None: "\\N"}
+        
+        fd, csv_path = tempfile.mkstemp(prefix="lineage_", suffix=".csv.gz")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", newline="", encoding="utf-8") as handle:
+                csv.writer(handle).writerows(
+                    (r.view_name, r.view_column, column_type_values[r.column_type],
+                     r.source_table, r.source_column, expression_type_values[r.expression_type])
+                    for r in results
+                )
+            
+            return self.db_manager.bulk_load_csv(
+                csv_path,
+                database_name,
+                schema_name,
+                table_name,
+                columns=list(_LINEAGE_TABLE_COLUMNS),
+            )
+        finally:
+            os.remove(csv_path)
\ No newline at end of file
@@ -1,27 +1,35 @@
 #!/usr/bin/env python3
 """Installation script for Column Lineage API."""
 
+import shutil
 import subprocess
 import sys
 import os
 
-def run_command(command, description):
-    """Run a command and handle errors."""
+def run_command(argv, description):
+    """Run a command (argv list, no shell) and handle errors; its output streams to the console."""
     print(f"🔄 {description}...")
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(argv, check=True)
         print(f"✅ {description} completed successfully")
         return result
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
         print(f"❌ {description} failed:")
-        print(f"Command: {command}")
-        print(f"Error: {e.stderr}")
+        print(f"Command: {' '.join(argv)}")
+        print(f"Error: {e}")
         return None
 
 def main():
     """Main installation function."""
     print("🚀 Installing Column Lineage API dependencies...")
     
+    # One directory scan for every file check below; nothing here creates
+    # or removes files in the project root before they are consulted
+    entries = {entry.name for entry in os.scandir('.')}
+    if 'pyproject.toml' not in entries:
+        print("❌ pyproject.toml not found. Run this script from the project root.")
+        return
+    
     # Check if we're in a virtual environment
     if not os.environ.get('VIRTUAL_ENV'):
         print("⚠️  Warning: Not in a virtual environment. Consider activating one first.")
@@ -30,25 +38,29 @@ def main():
             print("Installation cancelled.")
             return
     
-    # Install dependencies using pip with pyproject.toml
-    if not run_command("pip install -e .", "Installing main dependencies"):
-        return
-    
-    # Install development dependencies if requested
+    # Ask up front so main and dev dependencies resolve in a single install
     response = input("Install development dependencies? (y/N): ")
-    if response.lower() == 'y':
-        if not run_command("pip install -e .[dev]", "Installing development dependencies"):
-            return
+    with_dev = response.lower() == 'y'
+    target = ".[dev]" if with_dev else "."
+    description = "Installing main and development dependencies" if with_dev else "Installing main dependencies"
+    
+    # uv resolves much faster than pip, but only targets a virtual environment by default
+    installer = ["uv", "pip"] if os.environ.get('VIRTUAL_ENV') and shutil.which('uv') else ["pip"]
+    if not run_command([*installer, "install", "-e", target], description):
+        return
     
     # Install pre-commit hooks if available
-    if os.path.exists('.pre-commit-config.yaml'):
+    if '.pre-commit-config.yaml' in entries:
         response = input("Install pre-commit hooks? (y/N): ")
         if response.lower() == 'y':
-            run_command("pre-commit install", "Installing pre-commit hooks")
+            run_command(["pre-commit", "install"], "Installing pre-commit hooks")
     
     print("\n🎉 Installation completed!")
     print("\n📋 Next steps:")
-    print("1. Copy .env.example to .env and configure your settings")
+    if '.env' not in entries:
+        print("1. Copy .env.example to .env and configure your settings")
+    else:
+        print("1. Review the settings in .env")
     print("2. Run: python -m uvicorn api.main:app --reload")
     print("3. Visit: http://localhost:8000/docs")
 
@@ -1,20 +1,22 @@
 #!/usr/bin/env python3
 """Run script for Column Lineage API."""
 
+import argparse
+import importlib.util
 import os
+import shutil
 import sys
-import subprocess
 from pathlib import Path
 
 def check_env_file():
     """Check if .env file exists."""
-    if not os.path.exists('.env'):
+    env_file, example_file = Path('.env'), Path('.env.example')
+    if not env_file.is_file():
         print("⚠️  .env file not found!")
-        if os.path.exists('.env.example'):
+        if example_file.is_file():
             response = input("Copy .env.example to .env? (y/N): ")
             if response.lower() == 'y':
-                import shutil
-                shutil.copy('.env.example', '.env')
+                shutil.copyfile(example_file, env_file)
                 print("✅ .env file created. Please edit it with your configuration.")
                 return False
         else:
@@ -22,8 +24,40 @@ def check_env_file():
             return False
     return True
 
+def parse_args():
+    """Parse the server options."""
+    parser = argparse.ArgumentParser(description="Run the Column Lineage API with uvicorn.")
+    parser.add_argument(
+        "--reload",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Restart on code changes (default, unless --workers is given)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes; implies --no-reload",
+    )
+    args = parser.parse_args()
+    if args.reload is None:
+        args.reload = args.workers is None
+    if args.reload and args.workers:
+        parser.error("--reload cannot be combined with --workers")
+    return args
+
+def uvicorn_options(args):
+    """uvicorn flags for the chosen mode, preferring the C-accelerated HTTP parser and loop."""
+    options = ["--reload"] if args.reload else ["--workers", str(args.workers or 1)]
+    if importlib.util.find_spec("httptools"):
+        options += ["--http", "httptools"]
+    if importlib.util.find_spec("uvloop"):
+        options += ["--loop", "uvloop"]
+    return options
+
 def main():
     """Main run function."""
+    args = parse_args()
     print("🚀 Starting Column Lineage API...")
     
     # Add current directory to Python path
@@ -39,25 +73,30 @@ def main():
     os.environ.setdefault('PYTHONPATH', str(current_dir))
     
     # Run the application
+    cmd = [
+        sys.executable, "-m", "uvicorn", 
+        "api.main:app", 
+        "--host", "0.0.0.0", 
+        "--port", "8000", 
+        *uvicorn_options(args)
+    ]
+    
+    if args.workers and args.workers > 1:
+        # Jobs live in each worker's memory, so status/results calls only
+        # find a job when they land on the worker that started it
+        print(f"⚠️  Running {args.workers} workers: job status and results are per worker.")
+    
+    print("🌐 Starting server at http://localhost:8000")
+    print("📚 API docs available at http://localhost:8000/docs")
+    print("🔍 Health check at http://localhost:8000/health")
+    print("\nPress Ctrl+C to stop the server")
+    sys.stdout.flush()  # exec discards anything still buffered
+    
+    # Become the uvicorn process rather than waiting on it as a child;
+    # uvicorn then receives Ctrl+C directly
     try:
-        cmd = [
-            sys.executable, "-m", "uvicorn", 
-            "api.main:app", 
-            "--host", "0.0.0.0", 
-            "--port", "8000", 
-            "--reload"
-        ]
-        
-        print("🌐 Starting server at http://localhost:8000")
-        print("📚 API docs available at http://localhost:8000/docs")
-        print("🔍 Health check at http://localhost:8000/health")
-        print("\nPress Ctrl+C to stop the server")
-        
-        subprocess.run(cmd)
-        
-    except KeyboardInterrupt:
-        print("\n👋 Server stopped.")
-    except Exception as e:
+        os.execvp(sys.executable, cmd)
+    except OSError as e:
         print(f"❌ Error starting server: {e}")
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Test the analysis endpoint to make sure it works correctly."""
+
+import sys
+import requests
+import orjson
+
+from job_client import make_session, preflight, poll_job_status
+
+BASE_URL = "http://localhost:8000"
+
+# Test data; the body is serialized once at import and posted as-is
+TEST_REQUEST = {
+    "database_filter": "SNOWFLAKE_LEARNING_DB",
+    "schema_filter": "INFORMATION_SCHEMA",
+    "async_processing": True,
+    "include_metadata": True
+}
+REQUEST_BODY = orjson.dumps(TEST_REQUEST)
+
+ANALYZE_URL = f"{BASE_URL}/api/v1/lineage/analyze"
+
+SESSION = make_session()
+
+def test_analysis_endpoint():
+    """Test the analysis endpoint."""
+    print("🧪 Testing Analysis Endpoint")
+    print("=" * 40)
+    
+    headers = {
+        "Content-Type": "application/json",
+        # Add your JWT token here for authenticated endpoint
+        # "Authorization": "Bearer YOUR_TOKEN_HERE"
+    }
+    
+    try:
+        print("1. Testing analysis endpoint...")
+        print(f"Request: {orjson.dumps(TEST_REQUEST, option=orjson.OPT_INDENT_2).decode()}")
+        
+        # Use public endpoint for testing (if available) or authenticated endpoint
+        response = SESSION.post(
+            ANALYZE_URL,
+            data=REQUEST_BODY,
+            headers=headers,
+            timeout=30
+        )
+        
+        print(f"Status Code: {response.status_code}")
+        print(f"Response Headers: {dict(response.headers)}")
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            print(f"✅ Analysis started successfully!")
+            print(f"Job ID: {data.get('job_id')}")
+            print(f"Status: {data.get('status')}")
+            print(f"Message: {data.get('message')}")
+            
+            job_id = data.get('job_id')
+            if job_id:
+                print(f"\n2. Testing job status endpoint...")
+                status_response, status_data = poll_job_status(SESSION, BASE_URL, job_id, headers)
+                
+                if status_data is not None:
+                    print(f"✅ Job status retrieved!")
+                    print(f"Status: {status_data.get('status')}")
+                    print(f"Progress: {status_data.get('processed_views')}/{status_data.get('total_views')}")
+                else:
+                    print(f"❌ Job status failed: {status_response.status_code}")
+                    print(f"Error: {status_response.text}")
+            
+        elif response.status_code == 401:
+            print("❌ Authentication required. Please add your JWT token to the headers.")
+        else:
+            print(f"❌ Analysis failed:")
+            print(f"   Status: {response.status_code}")
+            print(f"   Text: {response.text}")
+            try:
+                error_data = orjson.loads(response.content)
+                print(f"   JSON: {orjson.dumps(error_data, option=orjson.OPT_INDENT_2).decode()}")
+            except:
+                pass
+                
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request Exception: {e}")
+    except Exception as e:
+        print(f"❌ Unexpected Error: {e}")
+
+if __name__ == "__main__":
+    if not preflight(BASE_URL):
+        print(f"❌ Server not reachable at {BASE_URL}")
+        sys.exit(1)
+    test_analysis_endpoint()
\ No newline at end of file
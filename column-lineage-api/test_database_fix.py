@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Test the fixed database queries."""
+
+import sys
+import requests
+from functools import lru_cache
+import orjson
+
+from job_client import make_session, preflight
+import time
+
+BASE_URL = "http://localhost:8000"
+
+SESSION = make_session()
+
+@lru_cache(maxsize=None)
+def get_databases():
+    """GET /public/databases once per run."""
+    return SESSION.get(f"{BASE_URL}/api/v1/lineage/public/databases", timeout=30)
+
+@lru_cache(maxsize=None)
+def get_schemas(database):
+    """GET /public/schemas once per database."""
+    return SESSION.get(
+        f"{BASE_URL}/api/v1/lineage/public/schemas",
+        params={"database_filter": database},
+        timeout=30
+    )
+
+def test_fixed_endpoints():
+    """Test the fixed API endpoints."""
+    print("🧪 Testing Fixed Database Endpoints")
+    print("=" * 50)
+    
+    try:
+        # Test databases endpoint
+        print("\n1. Testing databases endpoint...")
+        response = get_databases()
+        print(f"Status: {response.status_code}")
+        if response.status_code != 200:
+            print(f"❌ Databases error: {response.text}")
+            return
+        
+        databases = orjson.loads(response.content)
+        print(f"✅ Found {len(databases)} databases:")
+        for db in databases:
+            print(f"   - {db}")
+        if not databases:
+            print("⚠️  No databases found")
+            return
+        
+        # Test with the first database
+        test_db = databases[0]
+        print(f"\n2. Testing schemas for database: {test_db}")
+        response = get_schemas(test_db)
+        print(f"Status: {response.status_code}")
+        if response.status_code != 200:
+            print(f"❌ Schemas error: {response.text}")
+            return
+        
+        schemas = orjson.loads(response.content)
+        print(f"✅ Found {len(schemas)} schemas:")
+        for schema in schemas[:10]:  # Show first 10
+            print(f"   - {schema}")
+        if not schemas:
+            print("⚠️  No schemas found")
+            return
+        
+        # Test with the first schema
+        test_schema = schemas[0]
+        print(f"\n3. Testing views for {test_db}.{test_schema}")
+        response = SESSION.get(
+            f"{BASE_URL}/api/v1/lineage/public/views",
+            params={
+                "database_filter": test_db,
+                "schema_filter": test_schema,
+                "limit": 5
+            },
+            timeout=30
+        )
+        print(f"Status: {response.status_code}")
+        if response.status_code != 200:
+            print(f"❌ Views error: {response.text}")
+            return
+        
+        views = orjson.loads(response.content)
+        print(f"✅ Found {len(views)} views:")
+        for view in views:
+            print(f"   - {view['view_name']} ({view['column_count']} columns)")
+            
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request failed: {e}")
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+
+def main():
+    """Main test function."""
+    print("🚀 Testing Fixed Snowflake Database Queries")
+    print("Make sure your server is running on localhost:8000")
+    print()
+    
+    # Wait a moment
+    time.sleep(1)
+    
+    test_fixed_endpoints()
+    
+    print("\n✨ Test completed!")
+
+if __name__ == "__main__":
+    if not preflight(BASE_URL):
+        print(f"❌ Server not reachable at {BASE_URL}")
+        sys.exit(1)
+    main()
\ No newline at end of file
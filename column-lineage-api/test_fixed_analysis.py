@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Test the fixed analysis endpoint."""
+
+import sys
+import requests
+import orjson
+
+from job_client import preflight, watch_job_events
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional (dev extra); without it results are parsed in one go
+    ijson = None
+
+BASE_URL = "http://localhost:8000"
+
+# Test data - using a view that should exist. Serialized once at import, posted as-is
+TEST_REQUEST = {
+    "view_names": ["APPLICABLE_ROLES"],  # This view exists in INFORMATION_SCHEMA
+    "database_filter": "SNOWFLAKE_LEARNING_DB",
+    "schema_filter": "INFORMATION_SCHEMA",
+    "async_processing": False,  # Synchronous for testing
+    "include_metadata": True,
+    "max_views": 1
+}
+REQUEST_BODY = orjson.dumps(TEST_REQUEST)
+
+ANALYZE_URL = f"{BASE_URL}/api/v1/lineage/analyze"
+RESULTS_URL = f"{BASE_URL}/api/v1/lineage/results/{{}}"
+
+# Results bodies smaller than this are simply parsed whole with orjson
+STREAM_RESULTS_MIN_BYTES = 1024 * 1024
+
+def summarize_results(response):
+    """
+    Return (total_results, number of rows in 'results') from a results response.
+    
+    Large bodies are walked with ijson straight off the socket, so the rows are
+    counted without ever holding the whole payload in memory.
+    """
+    length = response.headers.get("Content-Length")
+    if ijson is None or (length is not None and int(length) < STREAM_RESULTS_MIN_BYTES):
+        data = orjson.loads(response.content)
+        return data.get('total_results'), len(data.get('results', []))
+    
+    response.raw.decode_content = True  # Let urllib3 undo any gzip
+    total_results = None
+    count = 0
+    for prefix, event, value in ijson.parse(response.raw):
+        if prefix == 'total_results' and event == 'number':
+            total_results = value
+        elif prefix == 'results.item' and event == 'start_map':
+            count += 1
+    return total_results, count
+
+def test_fixed_analysis():
+    """Test the fixed analysis endpoint."""
+    print("🧪 Testing Fixed Analysis Endpoint")
+    print("=" * 50)
+    
+    headers = {
+        "Content-Type": "application/json",
+        # Add your JWT token here
+        "Authorization": "Bearer YOUR_TOKEN_HERE"  # Replace with actual token
+    }
+    
+    try:
+        print("1. Testing analysis with INFORMATION_SCHEMA view...")
+        print(f"Request: {orjson.dumps(TEST_REQUEST, option=orjson.OPT_INDENT_2).decode()}")
+        
+        response = requests.post(
+            ANALYZE_URL,
+            data=REQUEST_BODY,
+            headers=headers,
+            timeout=60
+        )
+        
+        print(f"Status Code: {response.status_code}")
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            print(f"✅ Analysis response:")
+            print(f"   Job ID: {data.get('job_id')}")
+            print(f"   Status: {data.get('status')}")
+            print(f"   Message: {data.get('message')}")
+            
+            job_id = data.get('job_id')
+            if job_id:
+                print(f"\n2. Testing job status...")
+                status_response, status_data = watch_job_events(BASE_URL, job_id, headers)
+                
+                if status_data is not None:
+                    print(f"✅ Job status:")
+                    print(f"   Status: {status_data.get('status')}")
+                    print(f"   Total Views: {status_data.get('total_views')}")
+                    print(f"   Processed: {status_data.get('processed_views')}")
+                    print(f"   Results: {status_data.get('results_count')}")
+                    
+                    if status_data.get('status') == 'COMPLETED':
+                        print(f"\n3. Testing results...")
+                        results_response = requests.get(
+                            RESULTS_URL.format(job_id),
+                            headers=headers,
+                            stream=True,
+                            timeout=30
+                        )
+                        
+                        if results_response.status_code == 200:
+                            total_results, results_count = summarize_results(results_response)
+                            print(f"✅ Results retrieved:")
+                            print(f"   Total Results: {total_results}")
+                            print(f"   Results Count: {results_count}")
+                        else:
+                            print(f"❌ Results failed: {results_response.status_code}")
+                            print(f"   Error: {results_response.text}")
+                    
+                else:
+                    print(f"❌ Status failed: {status_response.status_code}")
+                    print(f"   Error: {status_response.text}")
+            
+        elif response.status_code == 401:
+            print("❌ Authentication required. Please add your JWT token to the headers.")
+        else:
+            print(f"❌ Analysis failed:")
+            print(f"   Status: {response.status_code}")
+            print(f"   Text: {response.text}")
+                
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request Exception: {e}")
+    except Exception as e:
+        print(f"❌ Unexpected Error: {e}")
+
+if __name__ == "__main__":
+    if not preflight(BASE_URL):
+        print(f"❌ Server not reachable at {BASE_URL}")
+        sys.exit(1)
+    test_fixed_analysis()
\ No newline at end of file
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Simple API test to verify the fix works."""
+
+import sys
+import requests
+import orjson
+
+from job_client import make_session, preflight
+
+BASE_URL = "http://localhost:8000"
+
+SESSION = make_session()
+
+def test_simple():
+    """Simple test of the API."""
+    print("🧪 Simple API Test")
+    print("=" * 30)
+    
+    try:
+        print("Testing databases endpoint...")
+        response = SESSION.get(f"{BASE_URL}/api/v1/lineage/public/databases", timeout=30)
+        
+        print(f"Status Code: {response.status_code}")
+        print(f"Response Headers: {dict(response.headers)}")
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            print(f"✅ Success! Found {len(data)} databases:")
+            for db in data:
+                print(f"   - {db}")
+        else:
+            print(f"❌ Error Response:")
+            print(f"   Status: {response.status_code}")
+            print(f"   Text: {response.text}")
+            try:
+                error_data = orjson.loads(response.content)
+                print(f"   JSON: {orjson.dumps(error_data, option=orjson.OPT_INDENT_2).decode()}")
+            except:
+                pass
+                
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request Exception: {e}")
+    except Exception as e:
+        print(f"❌ Unexpected Error: {e}")
+
+if __name__ == "__main__":
+    if not preflight(BASE_URL):
+        print(f"❌ Server not reachable at {BASE_URL}")
+        sys.exit(1)
+    test_simple()
\ No newline at end of file
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Test script to debug Snowflake connection issues.
+Run this script to test your Snowflake connection independently.
+"""
+
+import importlib.util
+import os
+import sys
+
+def check_dependencies():
+    """
+    Import the required dependencies, reporting any that are missing.
+    
+    Returns a dict of the imported objects for test_snowflake_connection to
+    use, or None when something is missing.
+    """
+    missing_deps = []
+    deps = {}
+    
+    try:
+        import snowflake.connector
+        deps["snowflake_connector"] = snowflake.connector
+    except ImportError:
+        missing_deps.append("snowflake-connector-python")
+    
+    # Presence only: SQLAlchemy loads the snowflake:// dialect itself
+    if importlib.util.find_spec("snowflake.sqlalchemy") is None:
+        missing_deps.append("snowflake-sqlalchemy")
+    
+    try:
+        from sqlalchemy import create_engine, text
+        from sqlalchemy.pool import StaticPool
+        deps.update(create_engine=create_engine, text=text, StaticPool=StaticPool)
+    except ImportError:
+        missing_deps.append("sqlalchemy")
+    
+    try:
+        from dotenv import load_dotenv
+        deps["load_dotenv"] = load_dotenv
+    except ImportError:
+        missing_deps.append("python-dotenv")
+    
+    if missing_deps:
+        print("❌ Missing required dependencies:")
+        for dep in missing_deps:
+            print(f"   - {dep}")
+        print("\nPlease install them using:")
+        print(f"   pip install {' '.join(missing_deps)}")
+        return None
+    
+    return deps
+
+def test_snowflake_connection():
+    """Test Snowflake connection with detailed debugging."""
+    
+    print("=== Snowflake Connection Test ===")
+    
+    # Check dependencies first; it hands back what it imported
+    deps = check_dependencies()
+    if deps is None:
+        return False
+    
+    snowflake_connector = deps["snowflake_connector"]
+    create_engine, text, StaticPool = deps["create_engine"], deps["text"], deps["StaticPool"]
+    load_dotenv = deps["load_dotenv"]
+    
+    # Load environment variables
+    load_dotenv()
+    
+    # Get Snowflake credentials
+    account = os.getenv("SNOWFLAKE_ACCOUNT")
+    user = os.getenv("SNOWFLAKE_USER")
+    password = os.getenv("SNOWFLAKE_PASSWORD")
+    database = os.getenv("SNOWFLAKE_DATABASE")
+    schema = os.getenv("SNOWFLAKE_SCHEMA")
+    warehouse = os.getenv("SNOWFLAKE_WAREHOUSE")
+    role = os.getenv("SNOWFLAKE_ROLE")
+    
+    print(f"Account: {account}")
+    print(f"User: {user}")
+    print(f"Database: {database}")
+    print(f"Schema: {schema}")
+    print(f"Warehouse: {warehouse}")
+    print(f"Role: {role}")
+    print(f"Password length: {len(password) if password else 0} characters")
+    print()
+    
+    if not all([account, user, password, database]):
+        print("❌ Missing required Snowflake credentials!")
+        missing = []
+        if not account: missing.append("SNOWFLAKE_ACCOUNT")
+        if not user: missing.append("SNOWFLAKE_USER") 
+        if not password: missing.append("SNOWFLAKE_PASSWORD")
+        if not database: missing.append("SNOWFLAKE_DATABASE")
+        print(f"Missing: {', '.join(missing)}")
+        return False
+    
+    # Test 1: Direct snowflake-connector-python connection
+    print("=== Test 1: Direct Snowflake Connector ===")
+    try:
+        print("Attempting direct connection...")
+        conn = snowflake_connector.connect(
+            user=user,
+            password=password,
+            account=account,
+            warehouse=warehouse,
+            database=database,
+            schema=schema,
+            role=role,
+            application="column-lineage-api-test",
+            login_timeout=60,
+            network_timeout=60
+        )
+        
+        print("Connection established, testing query...")
+        base_view_ok = False
+        # DictCursor rows are keyed by (upper-case) column alias
+        with conn.cursor(snowflake_connector.DictCursor) as cursor:
+            cursor.execute("SELECT CURRENT_VERSION() AS VERSION")
+            version = cursor.fetchone()["VERSION"]
+            print(f"✅ Direct connection successful! Snowflake version: {version}")
+            
+            # Test BASE_VIEW table
+            try:
+                print("Testing BASE_VIEW table access...")
+                # Count and sample in one query: the window count is taken
+                # before LIMIT, and no rows back means an empty table
+                cursor.execute(
+                    "SELECT SR_NO, TABLE_NAME, COUNT(*) OVER () AS TOTAL_ROWS FROM PUBLIC.BASE_VIEW LIMIT 5"
+                )
+                sample = cursor.fetchall()
+                count = sample[0]["TOTAL_ROWS"] if sample else 0
+                base_view_ok = True
+                print(f"✅ BASE_VIEW table found with {count} records")
+                
+                if sample:
+                    print("\nSample data:")
+                    for row in sample:
+                        print(f"  SR_NO: {row['SR_NO']}, TABLE_NAME: {row['TABLE_NAME']}")
+            except Exception as table_error:
+                print(f"❌ BASE_VIEW table test failed: {table_error}")
+                print("This might be because the table doesn't exist or you don't have permissions")
+        
+    except snowflake_connector.errors.DatabaseError as db_error:
+        print(f"❌ Direct connection failed - Database Error: {db_error}")
+        print(f"Error code: {db_error.errno}")
+        print(f"SQL state: {db_error.sqlstate}")
+        return False
+    except snowflake_connector.errors.ProgrammingError as prog_error:
+        print(f"❌ Direct connection failed - Programming Error: {prog_error}")
+        print("This usually means incorrect credentials or permissions")
+        return False
+    except Exception as e:
+        print(f"❌ Direct connection failed - General Error: {e}")
+        print(f"Error type: {type(e).__name__}")
+        
+        # Common troubleshooting
+        print("\n🔍 Troubleshooting suggestions:")
+        print("1. Check if your Snowflake account identifier is correct")
+        print("   - It should be in format: <account_locator> or <account_locator>.<region>")
+        print("   - Example: xy12345 or xy12345.us-east-1")
+        print("2. Verify your username and password are correct")
+        print("3. Check if your user has the required role permissions")
+        print("4. Ensure the warehouse is running and accessible")
+        print("5. Verify the database and schema exist")
+        print("6. Check if your IP is whitelisted (if network policies are enabled)")
+        print("7. Try logging into Snowflake web interface with the same credentials")
+        
+        return False
+    
+    # Test 2: SQLAlchemy connection
+    # The engine wraps the session Test 1 opened, so the script logs in once
+    print("\n=== Test 2: SQLAlchemy Connection (same session) ===")
+    engine = None
+    try:
+        engine = create_engine(
+            "snowflake://",
+            creator=lambda: conn,
+            poolclass=StaticPool,
+            echo=False,  # Disable SQL echo for cleaner output
+        )
+        
+        # Test connection; BASE_VIEW rides along in the same query when
+        # Test 1 could read it, so this is a single round trip either way
+        with engine.connect() as sa_conn:
+            if base_view_ok:
+                result = sa_conn.execute(
+                    text("SELECT CURRENT_VERSION(), COUNT(*) FROM PUBLIC.BASE_VIEW")
+                )
+                version, count = result.fetchone()
+                print(f"✅ SQLAlchemy connection successful! Snowflake version: {version}")
+                print(f"✅ BASE_VIEW table accessible via SQLAlchemy with {count} records")
+            else:
+                result = sa_conn.execute(text("SELECT CURRENT_VERSION()"))
+                version = result.fetchone()[0]
+                print(f"✅ SQLAlchemy connection successful! Snowflake version: {version}")
+                print("⚠️ Skipping BASE_VIEW via SQLAlchemy (not readable in Test 1)")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ SQLAlchemy connection failed: {e}")
+        return False
+    finally:
+        if engine is not None:
+            engine.dispose()
+        conn.close()
+
+if __name__ == "__main__":
+    success = test_snowflake_connection()
+    sys.exit(0 if success else 1)
\ No newline at end of file
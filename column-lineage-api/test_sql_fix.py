@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test script to verify the SQL fix for Snowflake column names."""
+
+import asyncio
+
+# How much of the catalog to sample, and how many queries to run at once
+MAX_DATABASES = 5
+SCHEMAS_PER_DATABASE = 2
+DISCOVERY_CONCURRENCY = 8
+
+async def test_database_queries(db_manager=None):
+    """Test the database and schema queries; reuses db_manager when given."""
+    print("🧪 Testing Snowflake SQL queries...")
+    
+    # Imported here: the service pulls in SQLAlchemy and the Snowflake driver
+    from api.v1.services.lineage_service import LineageService
+    
+    service = LineageService()
+    if db_manager is not None:
+        service.db_manager = db_manager
+    
+    # Fan out over the first few databases and schemas; the semaphore keeps
+    # the number of queries in flight below the DB thread/connection pool
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+    
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+    
+    try:
+        print("\n1. Testing get_available_databases()...")
+        databases = await service.get_available_databases()
+        print(f"✅ Found {len(databases)} databases: {databases}")
+        
+        if not databases:
+            print("⚠️  No databases found")
+            return
+        
+        sample_databases = databases[:MAX_DATABASES]
+        print(f"\n2. Testing get_available_schemas() for databases: {sample_databases}")
+        schemas_per_db = await asyncio.gather(
+            *(bounded(service.get_available_schemas(db)) for db in sample_databases)
+        )
+        for db, schemas in zip(sample_databases, schemas_per_db, strict=True):
+            print(f"✅ {db}: found {len(schemas)} schemas: {schemas}")
+        
+        targets = [
+            (db, schema)
+            for db, schemas in zip(sample_databases, schemas_per_db, strict=True)
+            for schema in schemas[:SCHEMAS_PER_DATABASE]
+        ]
+        if not targets:
+            print("⚠️  No schemas found")
+            return
+        
+        print(f"\n3. Testing get_available_views() for {len(targets)} schemas")
+        views_per_target = await asyncio.gather(
+            *(
+                bounded(service.get_available_views(schema_filter=schema, database_filter=db, limit=5))
+                for db, schema in targets
+            )
+        )
+        for (db, schema), views in zip(targets, views_per_target, strict=True):
+            print(f"✅ {db}.{schema}: found {len(views)} views")
+            for view in views[:3]:  # Show first 3 views
+                print(f"   - {view.view_name} ({view.column_count} columns)")
+            
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+
+if __name__ == "__main__":
+    asyncio.run(test_database_queries())
\ No newline at end of file
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Test synchronous analysis to debug the issue."""
+
+import sys
+import requests
+import orjson
+
+from job_client import make_session, preflight
+
+BASE_URL = "http://localhost:8000"
+
+SESSION = make_session()
+SESSION.headers.update({
+    # Add your JWT token here
+    "Authorization": "Bearer YOUR_TOKEN_HERE"  # Replace with actual token
+})
+
+def test_sync_analysis():
+    """Test synchronous analysis to see what happens."""
+    print("🧪 Testing Synchronous Analysis")
+    print("=" * 40)
+    
+    # Test data - using synchronous processing
+    test_request = {
+        "database_filter": "SNOWFLAKE_LEARNING_DB",
+        "schema_filter": "INFORMATION_SCHEMA",  # Try INFORMATION_SCHEMA first as it usually has views
+        "async_processing": False,  # Synchronous for debugging
+        "include_metadata": True
+    }
+    
+    try:
+        print("Testing synchronous analysis...")
+        print(f"Request: {orjson.dumps(test_request, option=orjson.OPT_INDENT_2).decode()}")
+        
+        response = SESSION.post(
+            f"{BASE_URL}/api/v1/lineage/analyze",
+            data=orjson.dumps(test_request),
+            timeout=60  # Longer timeout for sync processing
+        )
+        
+        print(f"Status Code: {response.status_code}")
+        
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            print(f"✅ Analysis completed!")
+            print(f"Job ID: {data.get('job_id')}")
+            print(f"Status: {data.get('status')}")
+            print(f"Message: {data.get('message')}")
+            
+        elif response.status_code == 401:
+            print("❌ Authentication required. Please add your JWT token to the headers.")
+        else:
+            print(f"❌ Analysis failed:")
+            print(f"   Status: {response.status_code}")
+            print(f"   Text: {response.text}")
+            try:
+                error_data = orjson.loads(response.content)
+                print(f"   JSON: {orjson.dumps(error_data, option=orjson.OPT_INDENT_2).decode()}")
+            except:
+                pass
+                
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Request Exception: {e}")
+    except Exception as e:
+        print(f"❌ Unexpected Error: {e}")
+
+if __name__ == "__main__":
+    if not preflight(BASE_URL):
+        print(f"❌ Server not reachable at {BASE_URL}")
+        sys.exit(1)
+    test_sync_analysis()
\ No newline at end of file
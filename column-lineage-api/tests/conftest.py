@@ -0,0 +1,151 @@
+"""Test configuration and fixtures."""
+
+import copy
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+from jose import jwt
+from unittest.mock import AsyncMock, Mock, patch
+
+from api.main import app
+from api.core.config import get_settings
+from api.dependencies.database import DatabaseManager
+from api.v1.services.job_manager import JobManager
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client fixture, shared by the session; app startup/shutdown run once."""
+    # localhost, not TestClient's default "testserver": TrustedHostMiddleware
+    # only accepts ALLOWED_HOSTS
+    with TestClient(app, base_url="http://localhost") as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Async test client that calls the app in-process on the test's own event loop."""
+    # localhost rather than httpx's usual "http://test": TrustedHostMiddleware
+    # only accepts ALLOWED_HOSTS
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_jobs():
+    """Empty the in-memory job store after each test, since the app outlives it."""
+    yield
+    job_manager = JobManager()
+    job_manager._jobs.clear()
+    job_manager._job_results.clear()
+
+
+@pytest.fixture(scope="session")
+def mock_settings():
+    """
+    Mock settings fixture.
+    
+    A private copy of the settings singleton (parsed once, at import), so the
+    overrides below never leak into the app or other tests.
+    """
+    settings = copy.deepcopy(get_settings())
+    settings.DEBUG = True
+    settings.JWT_SECRET_KEY = "test-secret-key"
+    return settings
+
+
+@pytest.fixture(scope="session")
+def db_manager():
+    """One DatabaseManager (and Snowflake login) shared by the whole test session."""
+    manager = DatabaseManager()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def mock_database():
+    """Mock database fixture."""
+    with patch('api.dependencies.database.DatabaseManager') as mock_db:
+        mock_instance = Mock()
+        mock_instance.test_connection.return_value = True
+        mock_instance.execute_query.return_value = []
+        mock_db.return_value = mock_instance
+        yield mock_instance
+
+
+@pytest.fixture
+def failing_database(monkeypatch):
+    """A live-mode DatabaseManager whose connection test fails, as seen by the health checks."""
+    mock_instance = Mock()
+    mock_instance.mock_mode = False
+    mock_instance.test_connection.return_value = False
+    # healthcheck binds DatabaseManager at import, so patch it where it is used
+    monkeypatch.setattr("api.health.healthcheck.DatabaseManager", lambda: mock_instance)
+    return mock_instance
+
+
+@pytest.fixture(autouse=True)
+def _mock_lineage(monkeypatch):
+    """Stub out lineage processing so analyze calls never start real work."""
+    monkeypatch.setattr(
+        "api.v1.services.lineage_service.LineageService.process_lineage_analysis",
+        AsyncMock(return_value=[]),
+    )
+
+
+@pytest.fixture(scope="session")
+def auth_headers(mock_settings):
+    """Authentication headers fixture, with a real token signed once per session."""
+    claims = {
+        "sub": "test-user",
+        "username": "test",
+        "email": "test@example.com",
+        "exp": int(time.time()) + 3600,
+    }
+    token = jwt.encode(claims, mock_settings.JWT_SECRET_KEY, algorithm="HS256")
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def sample_view_ddl():
+    """Sample view DDL for testing."""
+    return """
+    CREATE OR REPLACE VIEW TEST_VIEW AS
+    SELECT 
+        t1.column1,
+        t1.column2,
+        t2.column3 as renamed_column,
+        SUM(t1.amount) as total_amount
+    FROM table1 t1
+    JOIN table2 t2 ON t1.id = t2.id
+    GROUP BY t1.column1, t1.column2, t2.column3
+    """
+
+
+@pytest.fixture
+def sample_lineage_results():
+    """Sample lineage results for testing."""
+    from api.v1.models.lineage import ColumnLineageResult, ColumnType
+    
+    return [
+        ColumnLineageResult(
+            view_name="TEST_VIEW",
+            view_column="column1",
+            column_type=ColumnType.DIRECT,
+            source_table="table1",
+            source_column="column1",
+            confidence_score=1.0,
+        ),
+        ColumnLineageResult(
+            view_name="TEST_VIEW",
+            view_column="total_amount",
+            column_type=ColumnType.DERIVED,
+            source_table="table1",
+            source_column="amount",
+            confidence_score=0.8,
+        ),
+    ]
\ No newline at end of file
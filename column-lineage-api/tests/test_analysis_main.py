@@ -0,0 +1,111 @@
+"""Tests for the batched DDL prefetch and per-view fallback in the analysis module."""
+
+from contextlib import nullcontext
+
+import pandas as pd
+import pytest
+
+from api.core.analysis import main as analysis_main
+
+
+@pytest.fixture
+def empty_probe(monkeypatch):
+    """Make every INFORMATION_SCHEMA probe come back with no rows."""
+    analysis_main.clear_ddl_cache()
+    monkeypatch.setattr(
+        analysis_main.pd, "read_sql",
+        lambda *args, **kwargs: pd.DataFrame(
+            columns=["TABLE_CATALOG", "TABLE_SCHEMA", "TABLE_NAME", "LAST_ALTERED"]
+        ),
+    )
+
+
+class _FakeEngine:
+    def connect(self):
+        return nullcontext(object())
+
+
+def test_fetch_view_ddls_only_reports_unqualified_names_missing(empty_probe):
+    """Qualified names are left to the GET_DDL fallback rather than reported missing."""
+    ddls, missing = analysis_main.fetch_view_ddls(
+        _FakeEngine(), ["plain_view", "OTHER_SCHEMA.QUALIFIED_VIEW"]
+    )
+
+    assert ddls == {}
+    assert missing == {"PLAIN_VIEW"}
+
+
+def test_process_all_views_falls_back_for_qualified_names(empty_probe, monkeypatch):
+    """A qualified view the probe cannot see is still resolved through GET_DDL."""
+    requested = []
+
+    def fake_qualified_ddl(self, view_name):
+        requested.append(view_name)
+        return "create or replace view QUALIFIED_VIEW(ID) as SELECT t.ID FROM SOURCE_TABLE t;"
+
+    monkeypatch.setattr(
+        analysis_main._EngineWrappedConnection, "get_qualified_ddl", fake_qualified_ddl
+    )
+
+    result = analysis_main.process_all_views(
+        view_names=["OTHER_SCHEMA.QUALIFIED_VIEW", "PLAIN_VIEW"],
+        engine=_FakeEngine(),
+        max_workers=1,
+    )
+
+    assert requested == ["OTHER_SCHEMA.QUALIFIED_VIEW"]
+    assert result.successful_views == 1
+    assert analysis_main._error_row("PLAIN_VIEW", "DDL_NOT_FOUND") in result.csv_rows
+
+
+def test_cached_analyze_is_keyed_on_digest(monkeypatch):
+    """Repeat analyses hit the cache by SHA-1 alone and the DDL text is not retained."""
+    monkeypatch.setattr(analysis_main, "_analysis_cache", {})
+    parsed = []
+    monkeypatch.setattr(
+        analysis_main, "_parse_ddl_worker",
+        lambda ddl_text: parsed.append(ddl_text) or (None, "csv"),
+    )
+
+    first = analysis_main._cached_analyze("digest", "create view V as select 1;")
+    second = analysis_main._cached_analyze("digest", "create view V as select 1;")
+
+    assert first == second == (None, "csv")
+    assert parsed == ["create view V as select 1;"]
+    assert analysis_main._analysis_cache == {"digest": (None, "csv")}
+
+
+def test_parse_pool_spawns_workers_and_shuts_down(monkeypatch):
+    """The parse pool uses spawned workers and shutdown_parse_pool releases it."""
+    monkeypatch.setattr(analysis_main, "_analysis_cache", {})
+    ddl = "create or replace view V(ID) as SELECT t.ID FROM SOURCE_TABLE t;"
+    try:
+        error, csv_output = analysis_main._cached_analyze("pooled", ddl, parse_processes=1)
+        pool = analysis_main._parse_pool
+        assert pool._mp_context.get_start_method() == "spawn"
+    finally:
+        analysis_main.shutdown_parse_pool()
+
+    assert error is None
+    assert "V,ID,DIRECT,SOURCE_TABLE,ID" in csv_output
+    assert analysis_main._parse_pool is None
+
+
+@pytest.mark.parametrize(
+    ("view_name", "schema", "expected"),
+    [
+        ("V", "CPS_DSCI_API", "DDL CPS_DSCI_API.V"),
+        ("V", None, "DDL V"),
+        ("V", "OTHER", "DDL OTHER.V"),
+        ("S.V", "unused", "DDL S.V"),
+    ],
+)
+def test_get_qualified_ddl_picks_the_schema_probe_answer(monkeypatch, view_name, schema, expected):
+    """Speculative GET_DDL lookups never change which qualification is used."""
+    connection = analysis_main._EngineWrappedConnection("prod", _FakeEngine())
+    monkeypatch.setattr(connection, "find_view_in_schemas", lambda name: schema)
+    monkeypatch.setattr(
+        connection, "get_ddl_for_view", lambda name, log_errors=True: f"DDL {name}"
+    )
+
+    assert connection.get_qualified_ddl(view_name) == expected
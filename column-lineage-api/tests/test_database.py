@@ -0,0 +1,22 @@
+"""Tests for the SQL generated by the database manager."""
+
+from unittest.mock import MagicMock
+
+from api.dependencies.database import DatabaseManager
+
+
+def test_bulk_load_csv_escapes_null_marker(tmp_path):
+    """COPY INTO must receive the SQL literal '\\\\N' so Snowflake matches a literal \\N."""
+    manager = DatabaseManager()
+    manager.mock_mode = False
+    manager.engine = MagicMock()
+    conn = manager.engine.connect.return_value.__enter__.return_value
+    conn.execute.return_value.fetchall.return_value = []
+
+    manager.bulk_load_csv(str(tmp_path / "rows.csv.gz"), "DB", "SCH", "LINEAGE", ["A", "B"])
+
+    put_sql, copy_sql = (call.args[0].text for call in conn.execute.call_args_list)
+    assert put_sql.startswith("PUT 'file://")
+    assert "COPY INTO DB.SCH.LINEAGE (A, B)" in copy_sql
+    assert "FILES = ('rows.csv.gz')" in copy_sql
+    assert r"NULL_IF = ('\\N')" in copy_sql
@@ -0,0 +1,57 @@
+"""Tests for the streaming result exports."""
+
+import csv
+import io
+
+from api.v1.models.lineage import ColumnLineageResult, ColumnType, ExpressionType
+from api.v1.services import lineage_service as service_module
+from api.v1.services.lineage_service import LineageService
+
+
+def _results(count):
+    return [
+        ColumnLineageResult(
+            view_name="V",
+            view_column=f"c,{i}",
+            column_type=ColumnType.DIRECT if i % 2 else ColumnType.DERIVED,
+            source_table="T",
+            source_column=f"S{i}",
+            expression_type=None if i % 3 else ExpressionType.SUM,
+            confidence_score=1.0 if i % 2 else 0.8,
+            metadata={"analysis_method": "test"},
+        )
+        for i in range(count)
+    ]
+
+
+async def _export_csv(results, include_metadata):
+    service = LineageService()
+    return b"".join([chunk async for chunk in service._export_csv(results, include_metadata)])
+
+
+async def test_csv_export_matches_single_writer_pass():
+    """Batched chunks concatenate to exactly what one csv.writer pass produces."""
+    results = _results(service_module._EXPORT_BATCH_SIZE * 2 + 3)
+    
+    for include_metadata in (False, True):
+        expected = io.StringIO()
+        writer = csv.writer(expected)
+        writer.writerow(
+            service_module._EXPORT_HEADER_WITH_METADATA if include_metadata
+            else service_module._EXPORT_HEADER
+        )
+        writer.writerows(service_module._export_rows(results, include_metadata))
+        
+        assert await _export_csv(results, include_metadata) == expected.getvalue().encode("utf-8")
+
+
+async def test_csv_export_format():
+    """Strings are only quoted when needed, scores keep their float form and rows end in CRLF."""
+    output = await _export_csv(_results(2), include_metadata=False)
+    
+    assert output.decode("utf-8").split("\r\n") == [
+        "View_Name,View_Column,Column_Type,Source_Table,Source_Column,Expression_Type,Confidence_Score",
+        f'V,"c,0",DERIVED,T,S0,{ExpressionType.SUM.value},0.8',
+        'V,"c,1",DIRECT,T,S1,,1.0',
+        "",
+    ]
@@ -0,0 +1,232 @@
+"""Lineage API endpoint tests."""
+
+import asyncio
+
+from unittest.mock import Mock
+import httpx
+import orjson
+
+from api.v1.models.lineage import LineageAnalysisJob, JobStatus
+from api.v1.routers import lineage as lineage_router
+
+
+async def test_start_lineage_analysis(async_client: httpx.AsyncClient, auth_headers, mock_database):
+    """Test starting lineage analysis."""
+    request_data = {
+        "view_names": ["TEST_VIEW"],
+        "async_processing": False
+    }
+    
+    response = await async_client.post(
+        "/api/v1/lineage/analyze",
+        json=request_data,
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert "job_id" in data
+    # Analysis always runs as a background job, so the response reports it queued
+    assert data["status"] == "PENDING"
+    assert "results_url" in data
+
+
+async def test_start_async_lineage_analysis(async_client: httpx.AsyncClient, auth_headers, mock_database):
+    """Test starting async lineage analysis."""
+    request_data = {
+        "view_names": ["TEST_VIEW"],
+        "async_processing": True
+    }
+    
+    response = await async_client.post(
+        "/api/v1/lineage/analyze",
+        json=request_data,
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert "job_id" in data
+    assert data["status"] == "PENDING"
+    assert "results_url" in data
+
+
+async def test_get_job_status(async_client: httpx.AsyncClient, auth_headers):
+    """Test getting job status."""
+    # First create a job
+    request_data = {
+        "view_names": ["TEST_VIEW"],
+        "async_processing": True
+    }
+    
+    create_response = await async_client.post(
+        "/api/v1/lineage/analyze",
+        json=request_data,
+        headers=auth_headers
+    )
+    
+    job_id = create_response.json()["job_id"]
+    
+    # Then get its status
+    response = await async_client.get(
+        f"/api/v1/lineage/status/{job_id}",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert data["job_id"] == job_id
+    assert "status" in data
+    assert "created_at" in data
+
+
+async def test_get_job_status_not_modified(async_client: httpx.AsyncClient, auth_headers):
+    """Test that resending the status ETag as If-None-Match returns an empty 304."""
+    create_response = await async_client.post(
+        "/api/v1/lineage/analyze",
+        json={"view_names": ["TEST_VIEW"], "async_processing": True},
+        headers=auth_headers
+    )
+    job_id = create_response.json()["job_id"]
+    
+    first = await async_client.get(f"/api/v1/lineage/status/{job_id}", headers=auth_headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    
+    response = await async_client.get(
+        f"/api/v1/lineage/status/{job_id}",
+        headers={**auth_headers, "If-None-Match": etag}
+    )
+    
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+async def test_get_job_status_not_found(async_client: httpx.AsyncClient, auth_headers):
+    """Test getting status for non-existent job."""
+    fake_job_id = "00000000-0000-0000-0000-000000000000"
+    
+    response = await async_client.get(
+        f"/api/v1/lineage/status/{fake_job_id}",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 404
+
+
+async def _read_job_events(async_client: httpx.AsyncClient, job_id, headers):
+    """Read the whole event stream for a job and return its lines."""
+    async with async_client.stream(
+        "GET", f"/api/v1/lineage/events/{job_id}", headers=headers
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        return [line async for line in response.aiter_lines() if line]
+
+
+async def test_stream_job_events_completed_job(async_client: httpx.AsyncClient, auth_headers):
+    """Test that a finished job yields one status event and the stream closes."""
+    job = lineage_router.job_manager.create_job(LineageAnalysisJob(status=JobStatus.COMPLETED))
+    
+    lines = await _read_job_events(async_client, job.job_id, auth_headers)
+    
+    assert len(lines) == 1
+    assert lines[0].startswith("data: ")
+    event = orjson.loads(lines[0][len("data: "):])
+    assert event["job_id"] == str(job.job_id)
+    assert event["status"] == "COMPLETED"
+
+
+async def test_stream_job_events_keep_alive(async_client: httpx.AsyncClient, auth_headers, monkeypatch):
+    """Test that a quiet job gets keep-alive comments until it finishes."""
+    monkeypatch.setattr(lineage_router, "JOB_EVENTS_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(lineage_router, "JOB_EVENTS_KEEPALIVE_SECONDS", 0.0)
+    job = lineage_router.job_manager.create_job(LineageAnalysisJob(status=JobStatus.RUNNING))
+    
+    async def finish_job():
+        await asyncio.sleep(0.05)
+        lineage_router.job_manager.update_job_status(job.job_id, "COMPLETED")
+    
+    finisher = asyncio.create_task(finish_job())
+    lines = await _read_job_events(async_client, job.job_id, auth_headers)
+    await finisher
+    
+    assert lines[0].startswith("data: ")
+    assert ": keep-alive" in lines
+    assert orjson.loads(lines[-1][len("data: "):])["status"] == "COMPLETED"
+
+
+async def test_list_available_views(async_client: httpx.AsyncClient, auth_headers, mock_database):
+    """Test listing available views."""
+    # Mock the database response
+    mock_database.execute_query.return_value = [
+        Mock(
+            view_name="TEST_VIEW",
+            schema_name="TEST_SCHEMA",
+            database_name="TEST_DB",
+            created_date=None,
+            last_modified=None,
+            column_count=5
+        )
+    ]
+    
+    response = await async_client.get(
+        "/api/v1/lineage/views",
+        params={"schema_filter": "TEST_SCHEMA", "database_filter": "TEST_DB"},
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    
+    assert isinstance(data, list)
+    if data:  # If we have results
+        assert "view_name" in data[0]
+        assert "schema_name" in data[0]
+
+
+async def test_list_available_views_requires_filters(async_client: httpx.AsyncClient, auth_headers):
+    """Test that the schema and database filters are mandatory."""
+    response = await async_client.get(
+        "/api/v1/lineage/views",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 422
+
+
+async def test_list_jobs(async_client: httpx.AsyncClient, auth_headers):
+    """Test listing jobs."""
+    response = await async_client.get(
+        "/api/v1/lineage/jobs",
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert isinstance(data, list)
+
+
+async def test_unauthorized_access(async_client: httpx.AsyncClient):
+    """Test unauthorized access to protected endpoints."""
+    response = await async_client.post("/api/v1/lineage/analyze", json={})
+    assert response.status_code == 401  # No auth header
+
+
+async def test_invalid_request_data(async_client: httpx.AsyncClient, auth_headers):
+    """Test invalid request data."""
+    invalid_data = {
+        "max_views": -1  # Invalid value
+    }
+    
+    response = await async_client.post(
+        "/api/v1/lineage/analyze",
+        json=invalid_data,
+        headers=auth_headers
+    )
+    
+    assert response.status_code == 422  # Validation error
\ No newline at end of file
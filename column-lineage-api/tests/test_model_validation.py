@@ -0,0 +1,55 @@
+"""Guard tests: objects built with model_construct must still pass pydantic validation."""
+
+import copy
+from types import SimpleNamespace
+
+import pytest
+
+from api.v1.models.lineage import ColumnLineageResult, ViewInfo
+from api.v1.services.lineage_service import LineageService
+
+
+@pytest.fixture
+def service():
+    """A lineage service that skips validation, as in production."""
+    service = LineageService()
+    service._settings = copy.copy(service._settings)
+    service._settings.TRUST_ANALYSIS_OUTPUT = True
+    return service
+
+
+def test_converted_lineage_rows_validate(service):
+    """Rows from _convert_csv_rows_to_api_results round-trip through ColumnLineageResult."""
+    csv_rows = [
+        ["TEST_VIEW", "CUSTOMER_ID", "DIRECT", "CUSTOMERS", "ID", ""],
+        ["TEST_VIEW", "TOTAL", "DERIVED", "ORDERS", "AMOUNT", "SUM"],
+        ["TEST_VIEW", "ODD", "SOMETHING_NEW", "", "", "NOT_A_TYPE"],
+        ["BROKEN_VIEW", "ERROR", "ERROR", "DDL_NOT_FOUND", "DDL_NOT_FOUND", "ERROR"],
+    ]
+
+    results = service._convert_csv_rows_to_api_results(csv_rows)
+
+    assert len(results) == len(csv_rows)
+    for result in results:
+        validated = ColumnLineageResult.model_validate(result.model_dump())
+        assert validated == result
+
+
+async def test_discovered_views_validate(service, monkeypatch):
+    """ViewInfo objects built by _discover_views round-trip through ViewInfo."""
+    rows = [
+        SimpleNamespace(view_name="VIEW_A", schema_name="TEST_SCHEMA", database_name="TEST_DB"),
+        SimpleNamespace(view_name="VIEW_B", schema_name=None, database_name=None),
+    ]
+
+    async def fake_show_query(show_statement, scan_query, params=None):
+        return rows
+
+    monkeypatch.setattr(service, "_ashow_query", fake_show_query)
+
+    views = await service._discover_views("TEST_DB", "TEST_SCHEMA")
+
+    assert [view.view_name for view in views] == ["VIEW_A", "VIEW_B"]
+    for view in views:
+        validated = ViewInfo.model_validate(view.model_dump())
+        assert validated == view
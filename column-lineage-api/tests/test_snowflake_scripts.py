@@ -0,0 +1,24 @@
+"""Run the ad-hoc Snowflake check scripts against the shared session database manager."""
+
+import pytest
+
+import test_sql_fix as sql_fix_script
+import test_view_exists as view_exists_script
+
+
+@pytest.fixture
+def live_db_manager(db_manager):
+    """The session database manager, skipping when no Snowflake credentials are configured."""
+    if db_manager.mock_mode:
+        pytest.skip("Snowflake credentials not configured")
+    return db_manager
+
+
+def test_view_exists_script(live_db_manager):
+    """The view existence / DDL script runs on the shared connection."""
+    view_exists_script.test_view_exists(live_db_manager)
+
+
+async def test_sql_fix_script(live_db_manager):
+    """The discovery query script runs on the shared connection."""
+    await sql_fix_script.test_database_queries(live_db_manager)